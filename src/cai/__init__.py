@@ -1,7 +1,10 @@
 """
 A library to build Bug Bounty-level grade Cybersecurity AIs (CAIs).
 """
+from functools import lru_cache
 
+
+@lru_cache(maxsize=None)
 def is_pentestperf_available():
     """
     Check if pentestperf is available
@@ -13,6 +16,7 @@ def is_pentestperf_available():
     return True
 
 
+@lru_cache(maxsize=None)
 def is_caiextensions_report_available():
     """
     Check if caiextensions report is available
@@ -24,6 +28,7 @@ def is_caiextensions_report_available():
     return True
 
 
+@lru_cache(maxsize=None)
 def is_caiextensions_memory_available():
     """
     Check if caiextensions memory is available
@@ -35,6 +40,7 @@ def is_caiextensions_memory_available():
     return True
 
 
+@lru_cache(maxsize=None)
 def is_caiextensions_platform_available():
     """
     Check if caiextensions-platform is available
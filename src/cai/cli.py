@@ -143,8 +143,11 @@ if os.getenv("CAI_DEBUG", "1") != "2":
 
 import asyncio
 import logging
+import math
 import shlex
+import signal
 import time
+from functools import lru_cache
 
 # Configure comprehensive error filtering
 class ComprehensiveErrorFilter(logging.Filter):
@@ -282,15 +285,12 @@ def suppress_aiohttp_warnings():
 # Call the function to suppress aiohttp warnings
 suppress_aiohttp_warnings()
 
-# OpenAI imports
-from openai import AsyncOpenAI
 from rich.console import Console
 
 from cai import is_pentestperf_available
 
-# CAI agents and metrics imports
+# CAI agents imports
 from cai.agents import get_agent_by_name
-from cai.internal.components.metrics import process_metrics
 
 # CAI REPL imports
 from cai.repl.commands import FuzzyCommandCompleter, handle_command as commands_handle_command
@@ -301,6 +301,7 @@ from cai.repl.commands.parallel import PARALLEL_CONFIGS, ParallelConfig, PARALLE
 # Global storage for shared message histories (keyed by a unique identifier)
 UNIFIED_MESSAGE_HISTORIES = {}
 from cai.repl.ui.banner import display_banner, display_quick_guide
+from cai.repl.ui.early_input import drain_early_input, start_capturing_early_input
 from cai.repl.ui.keybindings import create_key_bindings
 from cai.repl.ui.logging import setup_session_logging
 from cai.repl.ui.prompt import get_user_input
@@ -323,6 +324,7 @@ from cai.sdk.agents.stream_events import RunItemStreamEvent
 from cai.util import (
     color,
     fix_litellm_transcription_annotations,
+    fix_message_list,
     setup_ctf,
     start_active_timer,
     start_idle_timer,
@@ -421,6 +423,68 @@ def update_agent_models_recursively(agent, new_model, visited=None):
                 update_agent_models_recursively(handoff_item, new_model, visited)
 
 
+async def _run_interruptible(coro):
+    """
+    Run a turn coroutine as a task with SIGINT wired to its cancellation.
+
+    A plain KeyboardInterrupt only fires at bytecode safe-points, so a
+    Ctrl-C during a long LLM/tool await can go unnoticed until the call
+    returns. Routing SIGINT to task.cancel() propagates the interrupt
+    into the awaitable immediately; the CancelledError is re-raised as
+    KeyboardInterrupt so the existing REPL handlers apply unchanged.
+    """
+    loop = asyncio.get_running_loop()
+    task = asyncio.ensure_future(coro)
+    sigint_wired = False
+    try:
+        loop.add_signal_handler(signal.SIGINT, task.cancel)
+        sigint_wired = True
+    except (NotImplementedError, RuntimeError, ValueError):
+        # Unsupported platform (e.g. Windows) or non-main thread; fall
+        # back to the default KeyboardInterrupt behavior
+        pass
+    try:
+        return await task
+    except asyncio.CancelledError:
+        raise KeyboardInterrupt() from None
+    finally:
+        if sigint_wired:
+            loop.remove_signal_handler(signal.SIGINT)
+
+
+def format_time(seconds):
+    """Format a duration in seconds as HH:MM:SS for the session summary."""
+    mins, secs = divmod(int(seconds), 60)
+    hours, mins = divmod(mins, 60)
+    return f"{hours:02d}:{mins:02d}:{secs:02d}"
+
+
+@lru_cache(maxsize=None)
+def _agent_model_env_var(agent_type):
+    """Env var name for an agent-type model override, built once per type."""
+    return f"CAI_{agent_type.upper()}_MODEL"
+
+
+# Constant portion of the guardrail warning, built once so each trigger
+# only formats the dynamic fields and issues a single stdout write
+_GUARDRAIL_WARNING_HEADER = "\n\033[91m🛡️  SECURITY GUARDRAIL TRIGGERED\033[0m\n"
+_GUARDRAIL_WARNING_FOOTER = (
+    "\033[93mThe agent's output was blocked for security reasons.\033[0m\n"
+    "\033[96mYou can continue the conversation with a different request.\033[0m\n\n"
+)
+
+
+def _print_output_guardrail_warning(guardrail_name, reason):
+    """Print the output-guardrail warning in one write instead of five."""
+    sys.stdout.write(
+        _GUARDRAIL_WARNING_HEADER
+        + f"\033[91mGuardrail: {guardrail_name}\033[0m\n"
+        + f"\033[91mReason: {reason}\033[0m\n"
+        + _GUARDRAIL_WARNING_FOOTER
+    )
+    sys.stdout.flush()
+
+
 def run_cai_cli(
     starting_agent, context_variables=None, max_turns=float("inf"), force_until_flag=False, initial_prompt=None
 ):
@@ -501,6 +565,15 @@ def run_cai_cli(
         if hasattr(agent.model, "set_agent_name"):
             agent.model.set_agent_name(get_agent_short_name(agent))
 
+    # The log file path is fixed for the session; build its banner once
+    # instead of importing rich.text and formatting it on every turn
+    from rich.text import Text
+
+    log_text = Text(
+        f"Log file: {session_logger.filename}",
+        style="yellow on black",
+    )
+
     prev_max_turns = max_turns
     turn_limit_reached = False
 
@@ -510,13 +583,14 @@ def run_cai_cli(
         global ctf_global
         global messages_ctf
         global ctf_init
-        if previous_ctf_name != os.getenv("CTF_NAME", None):
+        current_ctf_name = os.getenv("CTF_NAME", None)
+        if previous_ctf_name != current_ctf_name:
             if is_pentestperf_available():
                 if ctf_global:
                     ctf_global.stop_ctf()
                 ctf, messages_ctf = setup_ctf()
                 ctf_global = ctf
-                previous_ctf_name = os.getenv("CTF_NAME", None)
+                previous_ctf_name = current_ctf_name
                 ctf_init = 0
         # Check if CAI_MAX_TURNS has been updated via /config
         current_max_turns = os.getenv("CAI_MAX_TURNS", "inf")
@@ -531,7 +605,7 @@ def run_cai_cli(
                 )
 
         # Check if max turns is reached
-        if turn_count >= max_turns and max_turns != float("inf"):
+        if turn_count >= max_turns and max_turns != math.inf:
             if not turn_limit_reached:
                 turn_limit_reached = True
                 console.print(
@@ -547,13 +621,12 @@ def run_cai_cli(
         try:
             # Start measuring user idle time
             start_idle_timer()
-            import time
             idle_start_time = time.time()
 
             # Check if model has changed and update if needed
             current_model = os.getenv("CAI_MODEL", "alias1")
             # Check for agent-specific model override
-            agent_specific_model = os.getenv(f"CAI_{last_agent_type.upper()}_MODEL")
+            agent_specific_model = os.getenv(_agent_model_env_var(last_agent_type))
             if agent_specific_model:
                 current_model = agent_specific_model
 
@@ -653,7 +726,7 @@ def run_cai_cli(
 
                         # Apply current model to the new agent and all its handoff agents
                         # Check for agent-specific model override
-                        agent_specific_model = os.getenv(f"CAI_{current_agent_type.upper()}_MODEL")
+                        agent_specific_model = os.getenv(_agent_model_env_var(current_agent_type))
                         model_to_apply = (
                             agent_specific_model if agent_specific_model else current_model
                         )
@@ -691,12 +764,21 @@ def run_cai_cli(
                     user_input = initial_prompt
                     use_initial_prompt = False  # Only use it once
                 else:
-                    # Get user input with command completion and history
+                    # Get user input with command completion and history,
+                    # pre-filling anything typed while CAI was starting up
                     user_input = get_user_input(
-                        command_completer, kb, history_file, get_toolbar_with_refresh, current_text
+                        command_completer,
+                        kb,
+                        history_file,
+                        get_toolbar_with_refresh,
+                        current_text,
+                        default=drain_early_input(),
                     )
 
             else:
+                # First CTF turn: the priming message from setup_ctf is
+                # the turn input — intentionally a single run, after
+                # which the loop switches to interactive prompting
                 user_input = messages_ctf
                 ctf_init = 1
             idle_time += time.time() - idle_start_time
@@ -715,11 +797,6 @@ def run_cai_cli(
             # Print newline to ensure clean prompt display after interrupt
             print()
 
-            def format_time(seconds):
-                mins, secs = divmod(int(seconds), 60)
-                hours, mins = divmod(mins, 60)
-                return f"{hours:02d}:{mins:02d}:{secs:02d}"
-
             Total = time.time() - START_TIME
             idle_time += time.time() - idle_start_time
 
@@ -780,36 +857,31 @@ def run_cai_cli(
 
                 # Check if any tool calls are pending (have been issued but don't have responses)
                 pending_calls = []
-                if hasattr(agent.model, "_converter") and hasattr(
-                    agent.model._converter, "recent_tool_calls"
+                if (
+                    hasattr(agent.model, "_converter")
+                    and getattr(agent.model._converter, "recent_tool_calls", None)
                 ):
+                    # Index the message history once so each pending call is an
+                    # O(1) lookup instead of a full rescan per call
+                    tool_response_ids = {
+                        msg.get("tool_call_id")
+                        for msg in agent.model.message_history
+                        if msg.get("role") == "tool"
+                    }
+                    assistant_tool_call_ids = {
+                        tc.get("id")
+                        for msg in agent.model.message_history
+                        if msg.get("role") == "assistant" and msg.get("tool_calls")
+                        for tc in msg.get("tool_calls", [])
+                    }
                     for call_id, call_info in list(
                         agent.model._converter.recent_tool_calls.items()
                     ):
-                        # Check if this tool call has a corresponding response in message_history
-                        tool_response_exists = False
-                        for msg in agent.model.message_history:
-                            if msg.get("role") == "tool" and msg.get("tool_call_id") == call_id:
-                                tool_response_exists = True
-                                break
-
                         # If no tool response exists, create a synthetic one
-                        if not tool_response_exists:
-                            # First ensure there's a matching assistant message with this tool call
-                            assistant_exists = False
-                            for msg in agent.model.message_history:
-                                if (
-                                    msg.get("role") == "assistant"
-                                    and msg.get("tool_calls")
-                                    and any(
-                                        tc.get("id") == call_id for tc in msg.get("tool_calls", [])
-                                    )
-                                ):
-                                    assistant_exists = True
-                                    break
-
-                            # Add assistant message if needed
-                            if not assistant_exists:
+                        if call_id not in tool_response_ids:
+                            # Add assistant message if needed to ensure there's a
+                            # matching assistant message with this tool call
+                            if call_id not in assistant_tool_call_ids:
                                 tool_call_msg = {
                                     "role": "assistant",
                                     "content": None,
@@ -837,7 +909,6 @@ def run_cai_cli(
 
                 # Apply message list fixes to ensure consistency
                 if pending_calls:
-                    from cai.util import fix_message_list
 
                     agent.model.message_history[:] = fix_message_list(agent.model.message_history)
             except Exception:
@@ -889,25 +960,25 @@ def run_cai_cli(
                     Print a session summary panel using Rich.
                     """
                     from rich.box import ROUNDED
-                    from rich.console import Group
                     from rich.panel import Panel
                     from rich.text import Text
 
-                    # Create Rich Text objects for each line
-                    text_content = []
+                    # Build a single Text with newlines instead of one
+                    # Text per line wrapped in a Group
+                    body = Text()
                     for i, line in enumerate(content):
+                        if i:
+                            body.append("\n")
                         if "Total Session Cost" in line:
                             # Format cost line with special styling
-                            cost_text = Text()
-                            parts = line.split(":")
-                            cost_text.append(parts[0] + ":", style="bold")
-                            cost_text.append(parts[1], style="bold green")
-                            text_content.append(cost_text)
+                            label, _, value = line.partition(":")
+                            body.append(label + ":", style="bold")
+                            body.append(value, style="bold green")
                         else:
-                            text_content.append(Text(line))
+                            body.append(line)
 
                     time_panel = Panel(
-                        Group(*text_content),
+                        body,
                         border_style="blue",
                         box=ROUNDED,
                         padding=(0, 1),
@@ -926,6 +997,14 @@ def run_cai_cli(
                     and hasattr(session_logger, "session_id")
                     and hasattr(session_logger, "filename")
                 ):
+                    # Deferred import: the telemetry stack is only needed
+                    # on this shutdown path
+                    from cai.internal.components.metrics import process_metrics
+
+                    # Make sure queued log records are on disk before the
+                    # file is read back
+                    if hasattr(session_logger, "flush"):
+                        session_logger.flush()
                     process_metrics(
                         session_logger.filename,  # should match logging_path
                         sid=session_logger.session_id,
@@ -1296,10 +1375,14 @@ def run_cai_cli(
                 start_idle_timer()
                 continue
 
-            # Handle special commands
-            if user_input.startswith("/") or user_input.startswith("$"):
-                # Remove newlines from pasted input
-                cleaned_input = user_input.strip().replace('\n', '').replace('\r', '')
+            # Handle special commands (dispatch itself is a dict lookup in
+            # cai.repl.commands.base)
+            if user_input[:1] in ("/", "$"):
+                # Remove newlines from pasted input; skip the copies when
+                # there is nothing to strip out
+                cleaned_input = user_input.strip()
+                if "\n" in cleaned_input or "\r" in cleaned_input:
+                    cleaned_input = cleaned_input.replace("\n", "").replace("\r", "")
 
                 try:
                     # Parse with shell-like quoting support
@@ -1312,7 +1395,14 @@ def run_cai_cli(
                     continue
 
                 command = parts[0]
-                args = parts[1:] if len(parts) > 1 else None
+                if command in ("/shell", "/s", "$"):
+                    # Hand the shell the raw tail of the line: splitting
+                    # and rejoining tokens would strip the user's quoting
+                    # (e.g. /shell echo "a b")
+                    tail = cleaned_input.split(None, 1)
+                    args = [tail[1]] if len(tail) > 1 else None
+                else:
+                    args = parts[1:] if len(parts) > 1 else None
 
                 # Process the command with the handler
                 if commands_handle_command(command, args):
@@ -1322,18 +1412,15 @@ def run_cai_cli(
                 if command not in ("/shell", "/s"):
                     console.print(f"[red]Command failed or unknown: {command}[/red]")
                 continue
-            from rich.text import Text
-
-            log_text = Text(
-                f"Log file: {session_logger.filename}",
-                style="yellow on black",
-            )
             console.print(log_text)
 
             # Build conversation context from previous turns to give the
             # model short-term memory. We only keep messages that have plain
             # text content and ignore tool call entries to prevent schema
             # mismatches when converting to OpenAI chat format.
+            # NOTE: this loop is not a JIT/Numba candidate (heterogeneous
+            # dicts of str/list/None); speedups here come from indexing and
+            # fewer allocations, not compilation.
             history_context = []
             # Use the agent's model's message history directly instead of AGENT_MANAGER
             # This ensures compaction actually clears the history
@@ -1373,8 +1460,6 @@ def run_cai_cli(
 
             # Fix message list structure BEFORE sending to the model to prevent errors
             try:
-                from cai.util import fix_message_list
-
                 history_context = fix_message_list(history_context)
             except Exception:
                 pass
@@ -1479,12 +1564,9 @@ def run_cai_cli(
                             {"role": "assistant", "content": f"{result.final_output}"}
                         )
             else:
-                # Disable streaming by default, unless specifically enabled
-                cai_stream = os.getenv("CAI_STREAM", "false")
-                # Handle empty string or None values
-                if not cai_stream or cai_stream.strip() == "":
-                    cai_stream = "false"
-                stream = cai_stream.lower() == "true"
+                # Disable streaming by default, unless specifically enabled.
+                # An empty value counts as disabled.
+                stream = os.getenv("CAI_STREAM", "false").strip().lower() == "true"
 
                 # Single agent execution (original behavior)
                 if stream:
@@ -1494,7 +1576,11 @@ def run_cai_cli(
                         tool_results_seen = set()  # Track tool results by call_id
                         result = None
                         stream_iterator = None
-                        
+
+                        # Bind hot-loop names locally; the event loop below runs
+                        # once per streamed event
+                        add_to_history = agent.model.add_to_message_history
+
                         try:
                             result = Runner.run_streamed(agent, conversation_input)
                             stream_iterator = result.stream_events()
@@ -1502,7 +1588,8 @@ def run_cai_cli(
                             # Consume events so the async generator is executed.
                             async for event in stream_iterator:
                                 if isinstance(event, RunItemStreamEvent):
-                                    if event.name == "tool_called":
+                                    event_name = event.name
+                                    if event_name == "tool_called":
                                         # Track tool calls that were issued
                                         if hasattr(event.item, 'raw_item'):
                                             # For ToolCallItem, raw_item is a ResponseFunctionToolCall (or similar)
@@ -1510,7 +1597,7 @@ def run_cai_cli(
                                             call_id = getattr(event.item.raw_item, 'call_id', None)
                                             if call_id:
                                                 tool_calls_seen[call_id] = event.item
-                                    elif event.name == "tool_output":
+                                    elif event_name == "tool_output":
                                         # Ensure item is a ToolCallOutputItem before accessing attributes
                                         if isinstance(event.item, ToolCallOutputItem):
                                             call_id = event.item.raw_item["call_id"]
@@ -1520,7 +1607,7 @@ def run_cai_cli(
                                                 "tool_call_id": call_id,
                                                 "content": event.item.output,
                                             }
-                                            agent.model.add_to_message_history(tool_msg)
+                                            add_to_history(tool_msg)
 
                             return result
                         except (KeyboardInterrupt, asyncio.CancelledError) as e:
@@ -1582,18 +1669,16 @@ def run_cai_cli(
                             return None
 
                     try:
-                        asyncio.run(process_streamed_response(agent, conversation_input))
+                        asyncio.run(_run_interruptible(
+                            process_streamed_response(agent, conversation_input)
+                        ))
                     except OutputGuardrailTripwireTriggered as e:
                         # Display a user-friendly warning instead of crashing (streaming mode)
                         guardrail_name = e.guardrail_result.guardrail.get_name()
                         reason = e.guardrail_result.output.output_info.get("reason", "Security policy violation")
                         
                         # Use red color for the warning message
-                        print(f"\n\033[91m🛡️  SECURITY GUARDRAIL TRIGGERED\033[0m")
-                        print(f"\033[91mGuardrail: {guardrail_name}\033[0m")
-                        print(f"\033[91mReason: {reason}\033[0m")
-                        print(f"\033[93mThe agent's output was blocked for security reasons.\033[0m")
-                        print(f"\033[96mYou can continue the conversation with a different request.\033[0m\n")
+                        _print_output_guardrail_warning(guardrail_name, reason)
                         
                         # Continue the conversation loop instead of crashing
                         continue
@@ -1624,11 +1709,7 @@ def run_cai_cli(
                                 reason = e.guardrail_result.output.output_info.get("reason", "Security policy violation")
                                 
                                 # Use red color for the warning message
-                                print(f"\n\033[91m🛡️  SECURITY GUARDRAIL TRIGGERED\033[0m")
-                                print(f"\033[91mGuardrail: {guardrail_name}\033[0m")
-                                print(f"\033[91mReason: {reason}\033[0m")
-                                print(f"\033[93mThe agent's output was blocked for security reasons.\033[0m")
-                                print(f"\033[96mYou can continue the conversation with a different request.\033[0m\n")
+                                _print_output_guardrail_warning(guardrail_name, reason)
                                 
                                 # Close the loop and continue the conversation loop
                                 new_loop.close()
@@ -1639,9 +1720,14 @@ def run_cai_cli(
                         else:
                             raise
                 else:
-                    # Use non-streamed response
+                    # Use non-streamed response. Each turn runs the SDK's
+                    # async Runner under its own asyncio.run(): the LLM call,
+                    # tool execution and streaming all happen on that loop, so
+                    # the REPL thread only blocks on genuine network waits.
                     try:
-                        response = asyncio.run(Runner.run(agent, conversation_input))
+                        response = asyncio.run(_run_interruptible(
+                            Runner.run(agent, conversation_input)
+                        ))
                     except InputGuardrailTripwireTriggered as e:
                         # Display a user-friendly warning for input guardrails
                         reason = "Potential security threat detected in input"
@@ -1672,30 +1758,27 @@ def run_cai_cli(
                         reason = e.guardrail_result.output.output_info.get("reason", "Security policy violation")
                         
                         # Use red color for the warning message
-                        print(f"\n\033[91m🛡️  SECURITY GUARDRAIL TRIGGERED\033[0m")
-                        print(f"\033[91mGuardrail: {guardrail_name}\033[0m")
-                        print(f"\033[91mReason: {reason}\033[0m")
-                        print(f"\033[93mThe agent's output was blocked for security reasons.\033[0m")
-                        print(f"\033[96mYou can continue the conversation with a different request.\033[0m\n")
+                        _print_output_guardrail_warning(guardrail_name, reason)
                         
                         # Continue the conversation loop instead of crashing
                         continue
 
                     # En modo no-streaming, procesamos SOLO los tool outputs de response.new_items
                     # Los tool calls (assistant messages) ya se añaden correctamente en openai_chatcompletions.py
+                    # Index existing tool outputs once to avoid rescanning the
+                    # message history for every item in the response
+                    existing_tool_msg_ids = {
+                        msg.get("tool_call_id")
+                        for msg in agent.model.message_history
+                        if msg.get("role") == "tool"
+                    }
                     for item in response.new_items:
                         # Handle ONLY tool call output items (tool results)
                         if isinstance(item, ToolCallOutputItem):
                             tool_call_id = item.raw_item["call_id"]
 
                             # Verificar si ya existe este tool output en message_history para evitar duplicación
-                            tool_msg_exists = any(
-                                msg.get("role") == "tool"
-                                and msg.get("tool_call_id") == tool_call_id
-                                for msg in agent.model.message_history
-                            )
-
-                            if not tool_msg_exists:
+                            if tool_call_id not in existing_tool_msg_ids:
                                 # Añadir solo el tool output al message_history
                                 tool_msg = {
                                     "role": "tool",
@@ -1703,12 +1786,18 @@ def run_cai_cli(
                                     "content": item.output,
                                 }
                                 agent.model.add_to_message_history(tool_msg)
+                                existing_tool_msg_ids.add(tool_call_id)
 
                 # Final validation to ensure message history follows OpenAI's requirements
                 # Ensure every tool message has a preceding assistant message with matching tool_call_id
-                from cai.util import fix_message_list
-
-                agent.model.message_history[:] = fix_message_list(agent.model.message_history)
+                # Chat-only histories can't violate tool-call pairing, so
+                # skip the full O(N) rebuild unless tool traffic exists
+                history = agent.model.message_history
+                if any(
+                    msg.get("role") == "tool" or msg.get("tool_calls")
+                    for msg in history
+                ):
+                    history[:] = fix_message_list(history)
             turn_count += 1
 
             # Stop measuring active time and start measuring idle time again
@@ -1728,19 +1817,25 @@ def run_cai_cli(
 
             # Handle pending tool calls to prevent errors on next iteration
             try:
-                # Look for orphaned tool calls in the message history
+                # Look for orphaned tool calls in the message history. For
+                # chat-only histories the scan is skipped entirely; otherwise
+                # collect the ids of existing tool results once so each tool
+                # call is checked with a set lookup instead of a full rescan.
                 orphaned_tool_calls = []
-                for msg in agent.model.message_history:
-                    if msg.get("role") == "assistant" and msg.get("tool_calls"):
-                        for tool_call in msg["tool_calls"]:
-                            call_id = tool_call.get("id")
-                            if call_id:
-                                # Check if this tool call has a corresponding tool result
-                                has_result = any(
-                                    m.get("role") == "tool" and m.get("tool_call_id") == call_id
-                                    for m in agent.model.message_history
-                                )
-                                if not has_result:
+                if any(
+                    msg.get("role") == "assistant" and msg.get("tool_calls")
+                    for msg in agent.model.message_history
+                ):
+                    tool_result_ids = {
+                        m.get("tool_call_id")
+                        for m in agent.model.message_history
+                        if m.get("role") == "tool"
+                    }
+                    for msg in agent.model.message_history:
+                        if msg.get("role") == "assistant" and msg.get("tool_calls"):
+                            for tool_call in msg["tool_calls"]:
+                                call_id = tool_call.get("id")
+                                if call_id and call_id not in tool_result_ids:
                                     orphaned_tool_calls.append((call_id, tool_call))
 
                 # Add synthetic tool results for orphaned tool calls
@@ -1754,7 +1849,6 @@ def run_cai_cli(
                         agent.model.add_to_message_history(tool_response_msg)
 
                     # Apply message list fixes to ensure consistency
-                    from cai.util import fix_message_list
 
                     agent.model.message_history[:] = fix_message_list(agent.model.message_history)
                     
@@ -1836,6 +1930,10 @@ def create_last_log_symlink(log_filename):
 
 
 def main():
+    # Buffer keystrokes typed during startup so the first prompt can
+    # pre-fill them instead of dropping them
+    start_capturing_early_input()
+
     # Apply litellm patch to fix the __annotations__ error
     patch_applied = fix_litellm_transcription_annotations()
     if not patch_applied:
@@ -39,6 +39,25 @@ COMMAND_DESCRIPTIONS_CACHE = None
 SUBCOMMAND_DESCRIPTIONS_CACHE = None
 ALL_COMMANDS_CACHE = None
 
+# Aliases never change at runtime; sort them once instead of on every
+# completion request
+_SORTED_ALIASES = tuple(sorted(COMMAND_ALIASES.items()))
+
+
+@lru_cache(maxsize=512)
+def _styled_display(color, label, description, bold):
+    """Build (and memoize) the HTML display fragment for a suggestion.
+
+    HTML() parses its markup at construction time, so rebuilding the
+    same fragment on every keystroke is the bulk of the completer's
+    per-call allocations. The fragments only depend on the label and
+    description, which are static for a session.
+    """
+    if bold:
+        return HTML(
+            f"<{color}><b>{label:<15}</b></{color}> {description}")
+    return HTML(f"<{color}>{label:<15}</{color}> {description}")
+
 
 class FuzzyCommandCompleter(Completer):
     """Command completer with fuzzy matching for the REPL.
@@ -64,6 +83,7 @@ class FuzzyCommandCompleter(Completer):
     # Class-level cache for agents (with proper threading and time-based caching)
     _cached_agents = []
     _cached_agent_numbers = {}
+    _cached_agent_displays = {}
     _last_agent_fetch = datetime.datetime.now() - datetime.timedelta(minutes=10)
     _agent_fetch_lock = threading.Lock()
     
@@ -71,7 +91,11 @@ class FuzzyCommandCompleter(Completer):
         """Initialize the command completer with cached model and agent information."""
         super().__init__()
         self.command_history = {}  # Store command usage frequency
-        
+        # Commands sorted by usage; rebuilt only when usage changes
+        self._sorted_commands = None
+        # Prebuilt Completion objects for the empty-prompt case
+        self._top_level_completions = None
+
         # Fetch models in background thread to avoid blocking
         threading.Thread(
             target=self._background_fetch_models,
@@ -101,6 +125,30 @@ class FuzzyCommandCompleter(Completer):
             # Silently fail if agent fetching is not available
             pass
 
+    def _maybe_refresh_models(self):
+        """Kick off a background model refresh if the cache has expired.
+
+        Completion now runs on the UI thread, so the (potentially
+        network-bound) refresh must never happen inline; fetch_all_models
+        re-checks the TTL under its lock, making a stray extra thread
+        harmless.
+        """
+        now = datetime.datetime.now()
+        if (now - self._last_model_fetch).total_seconds() >= 60:
+            threading.Thread(
+                target=self._background_fetch_models,
+                daemon=True
+            ).start()
+
+    def _maybe_refresh_agents(self):
+        """Kick off a background agent refresh if the cache has expired."""
+        now = datetime.datetime.now()
+        if (now - self._last_agent_fetch).total_seconds() >= 60:
+            threading.Thread(
+                target=self._background_fetch_agents,
+                daemon=True
+            ).start()
+
     def fetch_all_agents(self):
         """Fetch all available agents to match /agent command."""
         # Only fetch every 60 seconds to avoid excessive calls
@@ -131,11 +179,19 @@ class FuzzyCommandCompleter(Completer):
                     regular_agents.append(agent_key)
                 
                 self._cached_agents = regular_agents
-                
+
                 # Create number mappings (1-based indexing)
                 self._cached_agent_numbers = {}
                 for i, agent_key in enumerate(self._cached_agents, 1):
                     self._cached_agent_numbers[str(i)] = agent_key
+
+                # Resolve display names here, in the background fetch,
+                # so completion never re-scans the agents package
+                self._cached_agent_displays = {
+                    agent_key: getattr(
+                        all_agents.get(agent_key), "name", agent_key)
+                    for agent_key in regular_agents
+                }
                     
             except Exception:  # pylint: disable=broad-except
                 # Silently fail if agent fetching is not available
@@ -237,6 +293,10 @@ class FuzzyCommandCompleter(Completer):
             else:
                 self.command_history[main_command] = 1
 
+            # Usage order changed; rebuild the sorted tables lazily
+            self._sorted_commands = None
+            self._top_level_completions = None
+
     @lru_cache(maxsize=1)
     def get_command_descriptions(self):
         """Get descriptions for all commands.
@@ -275,9 +335,47 @@ class FuzzyCommandCompleter(Completer):
         """
         global ALL_COMMANDS_CACHE
         if ALL_COMMANDS_CACHE is None:
-            ALL_COMMANDS_CACHE = {cmd.name: cmd.get_subcommands() for cmd in COMMANDS.values()}
+            # Pre-sort subcommands so completion doesn't sort per keystroke
+            ALL_COMMANDS_CACHE = {
+                cmd.name: sorted(cmd.get_subcommands())
+                for cmd in COMMANDS.values()
+            }
         return ALL_COMMANDS_CACHE
 
+    def _get_sorted_commands(self):
+        """Commands sorted by usage frequency, cached between keystrokes.
+
+        The sort only needs to happen again after record_command_usage
+        changes the frequencies, not on every completion request.
+        """
+        if self._sorted_commands is None:
+            self._sorted_commands = sorted(
+                self.get_command_descriptions().items(),
+                key=lambda x: self.command_history.get(x[0], 0),
+                reverse=True
+            )
+        return self._sorted_commands
+
+    def _get_top_level_completions(self):
+        """Prebuilt Completion objects for an empty prompt.
+
+        The empty-text case fires on every fresh prompt, so the
+        Completion objects are built once per usage-order change rather
+        than per keystroke.
+        """
+        if self._top_level_completions is None:
+            self._top_level_completions = tuple(
+                Completion(
+                    cmd,
+                    start_position=0,
+                    display=_styled_display(
+                        "ansicyan", cmd, description, True),
+                    style="fg:ansicyan bold"
+                )
+                for cmd, description in self._get_sorted_commands()
+            )
+        return self._top_level_completions
+
     # Cache for command suggestions to avoid recalculating
     _command_suggestions_cache = {}
     _command_suggestions_last_update = 0
@@ -306,12 +404,8 @@ class FuzzyCommandCompleter(Completer):
         # Get command descriptions
         command_descriptions = self.get_command_descriptions()
 
-        # Sort commands by usage frequency (for command shadowing)
-        sorted_commands = sorted(
-            command_descriptions.items(),
-            key=lambda x: self.command_history.get(x[0], 0),
-            reverse=True
-        )
+        # Commands sorted by usage frequency (for command shadowing)
+        sorted_commands = self._get_sorted_commands()
 
         # Add command completions
         for cmd, description in sorted_commands:
@@ -320,9 +414,8 @@ class FuzzyCommandCompleter(Completer):
                 suggestions.append(Completion(
                     cmd,
                     start_position=-len(current_word),
-                    display=HTML(
-                        f"<ansicyan><b>{cmd:<15}</b></ansicyan> "
-                        f"{description}"),
+                    display=_styled_display(
+                        "ansicyan", cmd, description, True),
                     style="fg:ansicyan bold"
                 ))
             # Fuzzy match (contains the substring)
@@ -330,30 +423,30 @@ class FuzzyCommandCompleter(Completer):
                 suggestions.append(Completion(
                     cmd,
                     start_position=-len(current_word),
-                    display=HTML(
-                        f"<ansicyan>{cmd:<15}</ansicyan> {description}"),
+                    display=_styled_display(
+                        "ansicyan", cmd, description, False),
                     style="fg:ansicyan"
                 ))
 
         # Add alias completions
-        for alias, cmd in sorted(COMMAND_ALIASES.items()):
+        for alias, cmd in _SORTED_ALIASES:
             cmd_description = command_descriptions.get(cmd, "")
             if alias.startswith(current_word):
                 suggestions.append(Completion(
                     alias,
                     start_position=-len(current_word),
-                    display=HTML(
-                        f"<ansigreen><b>{alias:<15}</b></ansigreen> "
-                        f"{cmd} - {cmd_description}"),
+                    display=_styled_display(
+                        "ansigreen", alias,
+                        f"{cmd} - {cmd_description}", True),
                     style="fg:ansigreen bold"
                 ))
             elif current_word in alias and not alias.startswith(current_word):
                 suggestions.append(Completion(
                     alias,
                     start_position=-len(current_word),
-                    display=HTML(
-                        f"<ansigreen>{alias:<15}</ansigreen> "
-                        f"{cmd} - {cmd_description}"),
+                    display=_styled_display(
+                        "ansigreen", alias,
+                        f"{cmd} - {cmd_description}", False),
                     style="fg:ansigreen"
                 ))
         
@@ -452,7 +545,7 @@ class FuzzyCommandCompleter(Completer):
         subcommand_descriptions = self.get_subcommand_descriptions()
 
         if cmd in all_commands:
-            for subcmd in sorted(all_commands[cmd]):
+            for subcmd in all_commands[cmd]:
                 # Get description for this subcommand if available
                 subcmd_description = subcommand_descriptions.get(
                     f"{cmd} {subcmd}", "")
@@ -462,9 +555,9 @@ class FuzzyCommandCompleter(Completer):
                     suggestions.append(Completion(
                         subcmd,
                         start_position=-len(current_word),
-                        display=HTML(
-                            f"<ansiyellow><b>{subcmd:<15}</b></ansiyellow> "
-                            f"{subcmd_description}"),
+                        display=_styled_display(
+                            "ansiyellow", subcmd,
+                            subcmd_description, True),
                         style="fg:ansiyellow bold"
                     ))
                 # Fuzzy match
@@ -473,9 +566,9 @@ class FuzzyCommandCompleter(Completer):
                     suggestions.append(Completion(
                         subcmd,
                         start_position=-len(current_word),
-                        display=HTML(
-                            f"<ansiyellow>{subcmd:<15}</ansiyellow> "
-                            f"{subcmd_description}"),
+                        display=_styled_display(
+                            "ansiyellow", subcmd,
+                            subcmd_description, False),
                         style="fg:ansiyellow"
                     ))
         
@@ -496,6 +589,9 @@ class FuzzyCommandCompleter(Completer):
         """
         suggestions = []
 
+        # Refresh models if needed, off the typing path
+        self._maybe_refresh_models()
+
         # First try to complete model numbers
         for num, model_name in self._cached_model_numbers.items():
             if num.startswith(current_word):
@@ -534,21 +630,16 @@ class FuzzyCommandCompleter(Completer):
         """Get agent suggestions for the /agent command."""
         suggestions = []
 
-        # Refresh agents if needed (non-blocking due to time-based caching)
-        self.fetch_all_agents()
+        # Refresh agents if needed, off the typing path
+        self._maybe_refresh_agents()
 
         # First try to complete agent numbers
         for num, agent_name in self._cached_agent_numbers.items():
             if num.startswith(current_word):
-                # Get agent display name for better UX
-                try:
-                    from cai.agents import get_available_agents
-                    agents = get_available_agents()
-                    agent_obj = agents.get(agent_name)
-                    display_name = getattr(agent_obj, "name", agent_name) if agent_obj else agent_name
-                except (ImportError, AttributeError, KeyError):  # pylint: disable=broad-except
-                    display_name = agent_name
-                    
+                # Display name resolved during the background fetch
+                display_name = self._cached_agent_displays.get(
+                    agent_name, agent_name)
+
                 suggestions.append(Completion(
                     num,
                     start_position=-len(current_word),
@@ -702,30 +793,15 @@ class FuzzyCommandCompleter(Completer):
         # Check if there's a trailing space (user finished typing a word)
         has_trailing_space = text_original and text_original[-1] == ' '
 
-        # Refresh Ollama models and agents periodically
-        self.fetch_all_models()
-        self.fetch_all_agents()
-
         if not text:
-            # Show all main commands with descriptions
-            command_descriptions = self.get_command_descriptions()
-
-            # Sort commands by usage frequency (for command shadowing)
-            sorted_commands = sorted(
-                command_descriptions.items(),
-                key=lambda x: self.command_history.get(x[0], 0),
-                reverse=True
-            )
+            # Show all main commands with descriptions, sorted by usage
+            # frequency (for command shadowing); prebuilt, nothing is
+            # allocated on this path
+            yield from self._get_top_level_completions()
+            return
 
-            for cmd, description in sorted_commands:
-                yield Completion(
-                    cmd,
-                    start_position=0,
-                    display=HTML(
-                        f"<ansicyan><b>{cmd:<15}</b></ansicyan> "
-                        f"{description}"),
-                    style="fg:ansicyan bold"
-                )
+        # Plain chat input: bail out before doing any completion work
+        if text[0] != '/':
             return
 
         if text.startswith('/'):
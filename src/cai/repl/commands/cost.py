@@ -9,7 +9,6 @@ from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
 from rich.columns import Columns
-from rich.progress import Progress, BarColumn, TextColumn
 from rich import box
 
 from cai.repl.commands.base import Command, register_command
@@ -3,6 +3,7 @@ Environment command for CAI REPL.
 This module provides commands for displaying environment variables.
 """
 import os
+import re
 from typing import (
     List,
     Optional
@@ -14,6 +15,9 @@ from cai.repl.commands.base import Command, register_command
 
 console = Console()
 
+# Variables whose values should be masked in the listing
+_SENSITIVE_RE = re.compile(r'key|token|secret|password', re.IGNORECASE)
+
 
 class EnvCommand(Command):
     """Command for displaying environment variables."""
@@ -43,9 +47,11 @@ class EnvCommand(Command):
         Returns:
             bool: True if the command was executed successfully
         """
-        # Get all environment variables
+        # Get the CAI/CTF environment variables; filter on the keys so
+        # no (key, value) tuples are materialized for the rest of the
+        # environment
         env_vars = {
-            k: v for k, v in os.environ.items() if k.startswith(
+            k: os.environ[k] for k in os.environ if k.startswith(
                 ('CAI_', 'CTF_'))}
 
         if not env_vars:
@@ -64,8 +70,7 @@ class EnvCommand(Command):
         # Add rows to the table with masked values for sensitive data
         for key, value in sorted(env_vars.items()):
             # Mask sensitive values (API keys, tokens, etc.)
-            if any(sensitive in key.lower()
-                   for sensitive in ['key', 'token', 'secret', 'password']):
+            if _SENSITIVE_RE.search(key):
                 # Show first half of the value, mask the rest
                 half_length = len(value) // 2
                 masked_value = value[:half_length] + \
@@ -8,7 +8,7 @@ showing the sequence of user and agent interactions, including tool calls.
 import os
 import importlib.util
 from typing import List, Optional
-from rich.console import Console  # pylint: disable=import-error
+from rich.console import Console, Group  # pylint: disable=import-error
 from rich.panel import Panel
 
 from cai.repl.commands.base import Command, register_command
@@ -262,12 +262,12 @@ class GraphCommand(Command):
             
             console.print(f"\n[bold]Conversation Graph for {agent_name}:[/bold]")
             console.print("-" * (20 + len(agent_name)))
-            
+
             if len(G.nodes) == 0:
                 console.print("[yellow]No messages to display in graph.[/yellow]")
             else:
-                for item in render_graph(G):
-                    console.print(item)
+                # Group the panels so the whole graph renders in one print
+                console.print(Group(*render_graph(G)))
             console.print()
             return True
             
@@ -744,8 +744,8 @@ class GraphCommand(Command):
                             if len(G.nodes) == 0:
                                 console.print("[yellow]No messages to display in graph.[/yellow]")
                             else:
-                                for item in render_graph(G):
-                                    console.print(item)
+                                # Group the panels so the whole graph renders in one print
+                                console.print(Group(*render_graph(G)))
                             console.print()
                             return True
                             
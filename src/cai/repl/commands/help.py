@@ -3,6 +3,7 @@ Help command for CAI REPL.
 This module provides commands for displaying help information.
 """
 
+from functools import lru_cache
 from typing import List, Optional
 
 try:
@@ -329,111 +330,16 @@ class HelpCommand(Command):
         Returns:
             True if successful
         """
-        console.print(
-            Panel(
-                Text.from_markup(
-                    "[bold]Welcome to CAI (Cybersecurity AI)[/bold]\n\n"
-                    "CAI is a powerful AI-driven security framework for penetration testing, "
-                    "bug bounty hunting, and security research.\n\n"
-                    "REMINDER: This is a work in progress. Please report any issues or feedback to the developer.\n"
-                    "[yellow]For detailed help on any topic, use:[/yellow] [bold]/help <topic>[/bold]\n"
-                    "[yellow]For a quick reference guide, use:[/yellow] [bold]/help quick[/bold]\n"
-                    "[yellow]To see all commands, use:[/yellow] [bold]/help commands[/bold]"
-                ),
-                title="🔒 CAI Help System",
-                border_style="yellow",
-            )
-        )
-
-        # Command Categories
-        categories = [
-            ("[bold yellow]Agent Management[/bold yellow]", [
-                ("[cyan]/agent[/cyan]", "Manage and switch between agents"),
-                ("[cyan]/parallel[/cyan]", "Configure parallel agent execution"),
-                ("[cyan]/run[/cyan]", "Queue prompts for execution"),
-            ]),
-            ("[bold green]Memory & History[/bold green]", [
-                ("[cyan]/memory[/cyan]", "Persistent memory management"),
-                ("[cyan]/history[/cyan]", "View conversation history"),
-                ("[cyan]/compact[/cyan]", "Compact conversations with AI"),
-                ("[cyan]/flush[/cyan]", "Clear agent histories"),
-                ("[cyan]/load[/cyan]", "Load JSONL conversation files"),
-                ("[cyan]/merge[/cyan]", "Merge agent histories"),
-            ]),
-            ("[bold blue]Environment & Config[/bold blue]", [
-                ("[cyan]/config[/cyan]", "Manage environment variables"),
-                ("[cyan]/env[/cyan]", "Display current environment"),
-                ("[cyan]/workspace[/cyan]", "Manage working directories"),
-                ("[cyan]/virtualization[/cyan]", "Docker container management"),
-            ]),
-            ("[bold magenta]Tools & Integration[/bold magenta]", [
-                ("[cyan]/mcp[/cyan]", "Model Context Protocol servers"),
-                ("[cyan]/platform[/cyan]", "Platform-specific features"),
-                ("[cyan]/shell[/cyan]", "Execute shell commands"),
-            ]),
-            ("[bold red]Utilities[/bold red]", [
-                ("[cyan]/model[/cyan]", "Change AI models"),
-                ("[cyan]/graph[/cyan]", "Visualize agent interactions"),
-                ("[cyan]/kill[/cyan]", "Terminate active processes"),
-                ("[cyan]/exit[/cyan]", "Exit CAI"),
-            ]),
-        ]
-
-        for category_name, commands in categories:
-            console.print(f"\n{category_name}")
-            table = Table(show_header=False, box=None, padding=(0, 2))
-            table.add_column(style="cyan", width=25)
-            table.add_column(style="white")
-            for cmd, desc in commands:
-                table.add_row(f"  {cmd}", desc)
-            console.print(table)
-
-        # Quick Tips
-        tips = Panel(
-            Text.from_markup(
-                "[bold]Quick Tips:[/bold]\n"
-                "• Use [bold cyan]Tab[/bold cyan] for command completion\n"
-                "• Use [bold cyan]↑/↓[/bold cyan] to navigate command history\n"
-                "• Use [bold cyan]Ctrl+C[/bold cyan] to interrupt running commands\n"
-                "• Use [bold cyan]Ctrl+L[/bold cyan] to clear the screen\n"
-                "• Most commands have aliases (e.g., [yellow]/h[/yellow] for [yellow]/help[/yellow])\n"
-                "• Type [yellow]/help <command>[/yellow] for detailed command help"
-            ),
-            title="💡 Tips",
-            border_style="cyan",
-        )
-        console.print("\n")
-        console.print(tips)
-
+        # The general help screen is entirely static; build its
+        # renderables once and just print them on later invocations
+        for renderable in _general_help_renderables():
+            console.print(renderable)
         return True
 
     def handle_help_aliases(self) -> bool:
         """Show all command aliases in a well-formatted table."""
-        # Create a styled header
-        console.print(Panel("Command Aliases Reference", border_style="magenta", title="Aliases"))
-
-        # Create a table for aliases
-        alias_table = create_styled_table(
-            "Command Aliases",
-            [("Alias", "green"), ("Command", "yellow"), ("Description", "white")],
-            "bold magenta",
-        )
-
-        # Add rows for each alias
-        for alias, command in sorted(COMMAND_ALIASES.items()):
-            cmd = COMMANDS.get(command)
-            description = cmd.description if cmd else ""
-            alias_table.add_row(alias, command, description)
-
-        console.print(alias_table)
-
-        # Add tips
-        tips = [
-            "Aliases can be used anywhere the full command would be used",
-            ("Example: [green]/m list[/green] instead of [yellow]/memory list[/yellow]"),
-        ]
-        console.print("\n")
-        console.print(create_notes_panel(tips, "Tips", "cyan"))
+        for renderable in _aliases_help_renderables():
+            console.print(renderable)
 
         return True
 
@@ -1205,3 +1111,117 @@ class HelpCommand(Command):
 
 # Register the command
 register_command(HelpCommand())
+
+
+@lru_cache(maxsize=1)
+def _general_help_renderables() -> tuple:
+    """Build the static renderables for the general /help screen once."""
+    renderables = [
+        Panel(
+            Text.from_markup(
+                "[bold]Welcome to CAI (Cybersecurity AI)[/bold]\n\n"
+                "CAI is a powerful AI-driven security framework for penetration testing, "
+                "bug bounty hunting, and security research.\n\n"
+                "REMINDER: This is a work in progress. Please report any issues or feedback to the developer.\n"
+                "[yellow]For detailed help on any topic, use:[/yellow] [bold]/help <topic>[/bold]\n"
+                "[yellow]For a quick reference guide, use:[/yellow] [bold]/help quick[/bold]\n"
+                "[yellow]To see all commands, use:[/yellow] [bold]/help commands[/bold]"
+            ),
+            title="🔒 CAI Help System",
+            border_style="yellow",
+        )
+    ]
+
+    # Command Categories
+    categories = [
+        ("[bold yellow]Agent Management[/bold yellow]", [
+            ("[cyan]/agent[/cyan]", "Manage and switch between agents"),
+            ("[cyan]/parallel[/cyan]", "Configure parallel agent execution"),
+            ("[cyan]/run[/cyan]", "Queue prompts for execution"),
+        ]),
+        ("[bold green]Memory & History[/bold green]", [
+            ("[cyan]/memory[/cyan]", "Persistent memory management"),
+            ("[cyan]/history[/cyan]", "View conversation history"),
+            ("[cyan]/compact[/cyan]", "Compact conversations with AI"),
+            ("[cyan]/flush[/cyan]", "Clear agent histories"),
+            ("[cyan]/load[/cyan]", "Load JSONL conversation files"),
+            ("[cyan]/merge[/cyan]", "Merge agent histories"),
+        ]),
+        ("[bold blue]Environment & Config[/bold blue]", [
+            ("[cyan]/config[/cyan]", "Manage environment variables"),
+            ("[cyan]/env[/cyan]", "Display current environment"),
+            ("[cyan]/workspace[/cyan]", "Manage working directories"),
+            ("[cyan]/virtualization[/cyan]", "Docker container management"),
+        ]),
+        ("[bold magenta]Tools & Integration[/bold magenta]", [
+            ("[cyan]/mcp[/cyan]", "Model Context Protocol servers"),
+            ("[cyan]/platform[/cyan]", "Platform-specific features"),
+            ("[cyan]/shell[/cyan]", "Execute shell commands"),
+        ]),
+        ("[bold red]Utilities[/bold red]", [
+            ("[cyan]/model[/cyan]", "Change AI models"),
+            ("[cyan]/graph[/cyan]", "Visualize agent interactions"),
+            ("[cyan]/kill[/cyan]", "Terminate active processes"),
+            ("[cyan]/exit[/cyan]", "Exit CAI"),
+        ]),
+    ]
+
+    for category_name, commands in categories:
+        renderables.append(f"\n{category_name}")
+        table = Table(show_header=False, box=None, padding=(0, 2))
+        table.add_column(style="cyan", width=25)
+        table.add_column(style="white")
+        for cmd, desc in commands:
+            table.add_row(f"  {cmd}", desc)
+        renderables.append(table)
+
+    # Quick Tips
+    renderables.append("\n")
+    renderables.append(Panel(
+        Text.from_markup(
+            "[bold]Quick Tips:[/bold]\n"
+            "• Use [bold cyan]Tab[/bold cyan] for command completion\n"
+            "• Use [bold cyan]↑/↓[/bold cyan] to navigate command history\n"
+            "• Use [bold cyan]Ctrl+C[/bold cyan] to interrupt running commands\n"
+            "• Use [bold cyan]Ctrl+L[/bold cyan] to clear the screen\n"
+            "• Most commands have aliases (e.g., [yellow]/h[/yellow] for [yellow]/help[/yellow])\n"
+            "• Type [yellow]/help <command>[/yellow] for detailed command help"
+        ),
+        title="💡 Tips",
+        border_style="cyan",
+    ))
+
+    return tuple(renderables)
+
+
+@lru_cache(maxsize=1)
+def _aliases_help_renderables() -> tuple:
+    """Build the /help aliases renderables once.
+
+    The alias table is fixed after command registration, so the header,
+    table and tips panel are assembled on first use and replayed on
+    every later invocation.
+    """
+    renderables = [
+        Panel("Command Aliases Reference", border_style="magenta", title="Aliases")
+    ]
+
+    alias_table = create_styled_table(
+        "Command Aliases",
+        [("Alias", "green"), ("Command", "yellow"), ("Description", "white")],
+        "bold magenta",
+    )
+    for alias, command in sorted(COMMAND_ALIASES.items()):
+        cmd = COMMANDS.get(command)
+        description = cmd.description if cmd else ""
+        alias_table.add_row(alias, command, description)
+    renderables.append(alias_table)
+
+    tips = [
+        "Aliases can be used anywhere the full command would be used",
+        ("Example: [green]/m list[/green] instead of [yellow]/memory list[/yellow]"),
+    ]
+    renderables.append("\n")
+    renderables.append(create_notes_panel(tips, "Tips", "cyan"))
+
+    return tuple(renderables)
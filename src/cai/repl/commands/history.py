@@ -705,18 +705,22 @@ class HistoryCommand(Command):
 
                 # Format arguments (pretty-print JSON if possible)
                 args_str = func_details.get("arguments", "{}")
-                try:
-                    # Parse and re-format JSON for better readability
-                    args_dict = json.loads(args_str)
-                    args_formatted = json.dumps(args_dict, indent=2)
-                    # Limit to first 200 chars for display
-                    if len(args_formatted) > 200:
-                        args_formatted = args_formatted[:197] + "..."
-                except (json.JSONDecodeError, TypeError):
-                    # If not valid JSON, use as is
-                    args_formatted = args_str
-                    if len(args_formatted) > 200:
-                        args_formatted = args_formatted[:197] + "..."
+                if len(args_str) > 200:
+                    # Only 200 chars are shown, and pretty-printing can
+                    # only grow the string — skip the parse/re-serialize
+                    # round-trip for large payloads and truncate raw
+                    args_formatted = args_str[:197] + "..."
+                else:
+                    try:
+                        # Parse and re-format JSON for better readability
+                        args_dict = json.loads(args_str)
+                        args_formatted = json.dumps(args_dict, indent=2)
+                        # Limit to first 200 chars for display
+                        if len(args_formatted) > 200:
+                            args_formatted = args_formatted[:197] + "..."
+                    except (json.JSONDecodeError, TypeError):
+                        # If not valid JSON, use as is
+                        args_formatted = args_str
 
                 result.append(f"Function: [bold blue]{func_name}[/bold blue]")
                 result.append(f"Args: {args_formatted}")
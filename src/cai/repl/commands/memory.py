@@ -38,6 +38,121 @@ def get_compact_model():
 
 console = Console()
 
+
+def _run_summary_coro(coro):
+    """
+    Run a summarization coroutine regardless of event-loop context.
+
+    The summarizer spawns its own agent run; when the REPL is already
+    inside a running loop, driving it with asyncio.run() would raise,
+    so execute it on a dedicated thread with a private event loop.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+
+    import concurrent.futures
+
+    def _run_in_thread():
+        new_loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(new_loop)
+        try:
+            return new_loop.run_until_complete(coro)
+        finally:
+            new_loop.close()
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(_run_in_thread).result()
+
+
+# Default instructions for the summary agent; built once at import
+# instead of on every summarization call
+DEFAULT_SUMMARY_INSTRUCTIONS = """You are an advanced conversation summarizer specializing in creating comprehensive continuity summaries for technical conversations. Your task is to analyze the conversation and create a detailed summary that will serve as context for continuing the work in a new session.
+
+## Primary Analysis Framework
+
+When analyzing the conversation, focus on:
+
+1. **Primary Request and Intent**
+   - What was the user's original request or problem?
+   - What were they trying to achieve?
+   - Were there any specific requirements or constraints mentioned?
+
+2. **Key Technical Concepts**
+   - What technical systems, frameworks, or concepts were discussed?
+   - What programming languages, tools, or technologies were involved?
+   - Were there any architectural patterns or design decisions made?
+
+3. **Files and Code Sections**
+   - List all files that were read, created, or modified
+   - Include file paths and brief descriptions of changes
+   - Highlight any critical code sections or functions
+   - Note any dependencies or relationships between files
+
+4. **Errors and Solutions**
+   - Document all errors encountered with their exact error messages
+   - Describe the solutions or fixes that were applied
+   - Note any workarounds or temporary solutions
+   - Include any unresolved issues
+
+5. **Problem Solving Progress**
+   - What steps were taken to solve the problem?
+   - What approaches were tried (both successful and unsuccessful)?
+   - What debugging or investigation was performed?
+   - What was the final state of the solution?
+
+6. **Conversation Metadata**
+   - All user messages in chronological order (verbatim if critical)
+   - Key decisions made during the conversation
+   - Any context switches or topic changes
+   - Important clarifications or confirmations
+
+7. **Current State and Next Steps**
+   - What is the current state of the work?
+   - What tasks were completed successfully?
+   - What remains to be done?
+   - Are there any pending questions or blockers?
+
+8. **Technical Artifacts**
+   - Any URLs, IPs, credentials, or configuration values discovered
+   - Command outputs or tool results that are important
+   - Error logs or stack traces
+   - Performance metrics or test results
+
+## Summary Structure
+
+Your summary should follow this structure:
+
+### Analysis
+Provide a chronological analysis of the conversation, explaining what happened step by step. This should read like a technical narrative that someone could follow to understand the progression of work.
+
+### Summary
+After the analysis, provide a structured summary with these sections:
+
+1. **Primary Request and Intent**: Brief description of what the user wanted
+2. **Key Technical Concepts**: Technologies and systems involved
+3. **Files and Code Sections**: List of all files touched with descriptions
+4. **Errors and Fixes**: Comprehensive list of all errors and their resolutions
+5. **Problem Solving**: Overview of approaches and solutions
+6. **All User Messages**: Complete list of user messages in order
+7. **Pending Tasks**: What still needs to be done
+8. **Current Work**: What was being worked on when the conversation ended
+9. **Optional Next Step**: If there's a clear next action, mention it
+
+## Important Guidelines
+
+- Be comprehensive but organized - include all important details but structure them clearly
+- Preserve exact error messages, file paths, and technical specifications
+- Include the complete chronological flow to maintain context
+- If code snippets are critical to understanding, include them
+- Maintain technical accuracy - don't paraphrase technical terms
+- The summary will be used as the primary context for resuming work, so completeness is crucial
+- When the conversation is resumed, it should feel like a natural continuation
+
+This session is being continued from a previous conversation that ran out of context. The conversation is summarized below:"""
+
+
 # Memory directory path - use home directory for cross-platform compatibility
 MEMORY_DIR = Path.home() / ".cai" / "memory"
 MEMORY_INDEX_FILE = MEMORY_DIR / "index.json"
@@ -362,19 +477,18 @@ class MemoryCommand(Command):
             # Get ID for this memory
             memory_id = file_to_id.get(memory_file.name, "---")
             
-            # Try to extract agent name from file
-            content = memory_file.read_text()
+            # Try to extract agent name from the file header; stream
+            # line by line so listing doesn't load each memory in full
             agent_name = "Unknown"
             created = "Unknown"
-            
-            # Parse metadata from memory file
-            for line in content.split('\n'):
-                if line.startswith("Agent: "):
-                    agent_name = line[7:]
-                elif line.startswith("Generated: "):
-                    created = line[11:]
-                if agent_name != "Unknown" and created != "Unknown":
-                    break
+            with memory_file.open(encoding="utf-8") as f:
+                for line in f:
+                    if line.startswith("Agent: "):
+                        agent_name = line[7:].rstrip('\n')
+                    elif line.startswith("Generated: "):
+                        created = line[11:].rstrip('\n')
+                    if agent_name != "Unknown" and created != "Unknown":
+                        break
             
             size = memory_file.stat().st_size
             table.add_row(
@@ -386,14 +500,17 @@ class MemoryCommand(Command):
             )
         
         console.print(table)
-        console.print("\n[dim]Commands:[/dim]")
-        console.print("[dim]  • /memory show <ID/name>    - View memory content[/dim]")
-        console.print("[dim]  • /memory apply <ID/name>   - Apply memory to P1 (default)[/dim]")
-        console.print("[dim]  • /memory apply <ID/name> all - Apply to all active agents[/dim]")
-        console.print("[dim]  • /memory delete <ID/name>  - Delete a memory[/dim]")
-        console.print("[dim]  • /memory merge <ID1> <ID2> - Merge multiple memories[/dim]")
-        console.print("[dim]\nNote: You can use either the memory ID (e.g., M001) or the full name[/dim]")
-        
+        # Single print so the whole footer goes out in one flush
+        console.print(
+            "\n[dim]Commands:[/dim]\n"
+            "[dim]  • /memory show <ID/name>    - View memory content[/dim]\n"
+            "[dim]  • /memory apply <ID/name>   - Apply memory to P1 (default)[/dim]\n"
+            "[dim]  • /memory apply <ID/name> all - Apply to all active agents[/dim]\n"
+            "[dim]  • /memory delete <ID/name>  - Delete a memory[/dim]\n"
+            "[dim]  • /memory merge <ID1> <ID2> - Merge multiple memories[/dim]\n"
+            "[dim]\nNote: You can use either the memory ID (e.g., M001) or the full name[/dim]"
+        )
+
         return True
     
     def handle_save(self, args: Optional[List[str]] = None, preserve_history: bool = True) -> bool:
@@ -426,7 +543,7 @@ class MemoryCommand(Command):
         console.print(f"\n[cyan]Saving memory for {agent_name}...[/cyan]")
         
         # Generate summary
-        summary = asyncio.run(self._ai_summarize_history(agent_name))
+        summary = _run_summary_coro(self._ai_summarize_history(agent_name))
         
         if summary:
             # Generate unique ID for this memory
@@ -933,7 +1050,7 @@ Model: Merged from {len(memory_identifiers)} memories
         for agent_name in all_histories:
             console.print(f"\n[cyan]Compacting {agent_name}...[/cyan]")
             # Generate summary for this agent
-            summary = asyncio.run(self._ai_summarize_history(agent_name))
+            summary = _run_summary_coro(self._ai_summarize_history(agent_name))
             
             if summary:
                 # Generate unique ID for this memory
@@ -1036,7 +1153,7 @@ Model: {get_compact_model() or os.environ.get("CAI_MODEL", "gpt-4")}
         console.print(f"\n[cyan]Compacting {agent_name} ({original_count} messages)...[/cyan]")
         
         # Generate summary
-        summary = asyncio.run(self._ai_summarize_history(agent_name))
+        summary = _run_summary_coro(self._ai_summarize_history(agent_name))
         
         if summary:
             # Generate unique ID for this memory
@@ -1151,89 +1268,7 @@ Model: {get_compact_model() or os.environ.get("CAI_MODEL", "gpt-4")}
         if custom_prompt:
             instructions = custom_prompt
         else:
-            instructions = """You are an advanced conversation summarizer specializing in creating comprehensive continuity summaries for technical conversations. Your task is to analyze the conversation and create a detailed summary that will serve as context for continuing the work in a new session.
-
-## Primary Analysis Framework
-
-When analyzing the conversation, focus on:
-
-1. **Primary Request and Intent**
-   - What was the user's original request or problem?
-   - What were they trying to achieve?
-   - Were there any specific requirements or constraints mentioned?
-
-2. **Key Technical Concepts**
-   - What technical systems, frameworks, or concepts were discussed?
-   - What programming languages, tools, or technologies were involved?
-   - Were there any architectural patterns or design decisions made?
-
-3. **Files and Code Sections**
-   - List all files that were read, created, or modified
-   - Include file paths and brief descriptions of changes
-   - Highlight any critical code sections or functions
-   - Note any dependencies or relationships between files
-
-4. **Errors and Solutions**
-   - Document all errors encountered with their exact error messages
-   - Describe the solutions or fixes that were applied
-   - Note any workarounds or temporary solutions
-   - Include any unresolved issues
-
-5. **Problem Solving Progress**
-   - What steps were taken to solve the problem?
-   - What approaches were tried (both successful and unsuccessful)?
-   - What debugging or investigation was performed?
-   - What was the final state of the solution?
-
-6. **Conversation Metadata**
-   - All user messages in chronological order (verbatim if critical)
-   - Key decisions made during the conversation
-   - Any context switches or topic changes
-   - Important clarifications or confirmations
-
-7. **Current State and Next Steps**
-   - What is the current state of the work?
-   - What tasks were completed successfully?
-   - What remains to be done?
-   - Are there any pending questions or blockers?
-
-8. **Technical Artifacts**
-   - Any URLs, IPs, credentials, or configuration values discovered
-   - Command outputs or tool results that are important
-   - Error logs or stack traces
-   - Performance metrics or test results
-
-## Summary Structure
-
-Your summary should follow this structure:
-
-### Analysis
-Provide a chronological analysis of the conversation, explaining what happened step by step. This should read like a technical narrative that someone could follow to understand the progression of work.
-
-### Summary
-After the analysis, provide a structured summary with these sections:
-
-1. **Primary Request and Intent**: Brief description of what the user wanted
-2. **Key Technical Concepts**: Technologies and systems involved
-3. **Files and Code Sections**: List of all files touched with descriptions
-4. **Errors and Fixes**: Comprehensive list of all errors and their resolutions
-5. **Problem Solving**: Overview of approaches and solutions
-6. **All User Messages**: Complete list of user messages in order
-7. **Pending Tasks**: What still needs to be done
-8. **Current Work**: What was being worked on when the conversation ended
-9. **Optional Next Step**: If there's a clear next action, mention it
-
-## Important Guidelines
-
-- Be comprehensive but organized - include all important details but structure them clearly
-- Preserve exact error messages, file paths, and technical specifications
-- Include the complete chronological flow to maintain context
-- If code snippets are critical to understanding, include them
-- Maintain technical accuracy - don't paraphrase technical terms
-- The summary will be used as the primary context for resuming work, so completeness is crucial
-- When the conversation is resumed, it should feel like a natural continuation
-
-This session is being continued from a previous conversation that ran out of context. The conversation is summarized below:"""
+            instructions = DEFAULT_SUMMARY_INSTRUCTIONS
         
         summary_agent = Agent(
             name="Summary Agent",
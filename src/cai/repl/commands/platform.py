@@ -2,6 +2,7 @@
 Platform command for CAI REPL.
 This module provides commands for interacting with platform-specific features.
 """
+from functools import lru_cache
 from typing import (
     List,
     Optional
@@ -15,6 +16,20 @@ from cai.repl.commands.base import Command, register_command
 console = Console()
 
 
+@lru_cache(maxsize=1)
+def _list_platforms():
+    """Platform names, fetched once per session."""
+    from caiextensions.platform.base import platform_manager  # pylint: disable=import-error,import-outside-toplevel,no-name-in-module
+    return tuple(platform_manager.list_platforms())
+
+
+@lru_cache(maxsize=None)
+def _platform_commands(name):
+    """Command list for one platform, fetched once per session."""
+    from caiextensions.platform.base import platform_manager  # pylint: disable=import-error,import-outside-toplevel,no-name-in-module
+    return tuple(platform_manager.get_platform(name).get_commands())
+
+
 class PlatformCommand(Command):
     """Command for interacting with platform-specific features."""
 
@@ -26,10 +41,12 @@ class PlatformCommand(Command):
             aliases=["/p"]
         )
 
-        # Add subcommands dynamically based on available platforms
-        if is_caiextensions_platform_available():
-            from caiextensions.platform.base import platform_manager  # pylint: disable=import-error,import-outside-toplevel,unused-import,line-too-long,no-name-in-module # noqa: E501
+        # Platform-specific subcommands are only needed for completion,
+        # so they are loaded lazily on first access rather than walking
+        # every platform's command list at import time.
+        self._platform_subcommands_loaded = False
 
+        if is_caiextensions_platform_available():
             # Add list subcommand
             self.add_subcommand(
                 "list",
@@ -48,19 +65,32 @@ class PlatformCommand(Command):
                 "Keep VPN connection active even when interrupted",
                 self.handle_keep_vpn)
 
-            # Add platform-specific subcommands
-            platforms = platform_manager.list_platforms()
-            for platform in platforms:
-                platform_cmds = platform_manager.get_platform(
-                    platform).get_commands()
-                for cmd in platform_cmds:
-                    # Add platform-specific commands as subcommands
-                    self.add_subcommand(
-                        f"{platform}:{cmd}",
-                        f"Execute {cmd} command on {platform} platform",
-                        lambda args, p=platform, c=cmd:
-                            self.handle_platform_command([p, c] + (args or []))
-                    )
+    def _load_platform_subcommands(self) -> None:
+        """Populate platform-specific subcommands on first use."""
+        if (self._platform_subcommands_loaded
+                or not is_caiextensions_platform_available()):
+            return
+        self._platform_subcommands_loaded = True
+
+        for platform in _list_platforms():
+            for cmd in _platform_commands(platform):
+                # Add platform-specific commands as subcommands
+                self.add_subcommand(
+                    f"{platform}:{cmd}",
+                    f"Execute {cmd} command on {platform} platform",
+                    lambda args, p=platform, c=cmd:
+                        self.handle_platform_command([p, c] + (args or []))
+                )
+
+    def get_subcommands(self) -> List[str]:
+        """List subcommand names, loading platform commands on demand."""
+        self._load_platform_subcommands()
+        return super().get_subcommands()
+
+    def get_subcommand_description(self, subcommand: str) -> str:
+        """Get a subcommand description, loading platform commands on demand."""
+        self._load_platform_subcommands()
+        return super().get_subcommand_description(subcommand)
 
     def handle(self, args: Optional[List[str]] = None) -> bool:
         """Handle the platform command.
@@ -83,8 +113,7 @@ class PlatformCommand(Command):
             console.print("[red]Platform extensions are not available[/red]")
             return False
 
-        from caiextensions.platform.base import platform_manager  # pylint: disable=import-error,import-outside-toplevel,unused-import,line-too-long,no-name-in-module # noqa: E501
-        platforms = platform_manager.list_platforms()
+        platforms = _list_platforms()
 
         console.print(Panel(
             "\n".join(f"[green]{p}[/green]" for p in platforms),
@@ -104,7 +133,7 @@ class PlatformCommand(Command):
 
         if not args:
             # Show available platforms
-            platforms = platform_manager.list_platforms()
+            platforms = _list_platforms()
             console.print(Panel(
                 "\n".join(f"[green]{p}[/green]" for p in platforms),
                 title="Available Platforms",
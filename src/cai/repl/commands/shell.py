@@ -3,8 +3,12 @@ Shell command for CAI REPL.
 This module provides commands for executing shell commands.
 """
 import os
+import re
+import select
+import shlex
 import signal
 import subprocess  # nosec B404
+import sys
 from typing import (
     List,
     Optional
@@ -16,6 +20,10 @@ from cai.tools.common import _get_workspace_dir, _get_container_workspace_path
 
 console = Console()
 
+# Commands that should run in async mode (interactive/long-lived). Word
+# boundaries keep e.g. 'rsync' or 'cnc_tool' from matching 'nc'.
+_ASYNC_CMD_RE = re.compile(r'\b(?:nc|netcat|ncat|telnet|ssh|python -m http\.server)\b')
+
 
 class ShellCommand(Command):
     """Command for executing shell commands."""
@@ -51,8 +59,8 @@ class ShellCommand(Command):
         original_command = " ".join(command_args)
         active_container = os.getenv("CAI_ACTIVE_CONTAINER", "")
 
-        # List of known async-style commands
-        is_async = any(cmd in original_command for cmd in ['nc', 'netcat', 'ncat', 'telnet', 'ssh', 'python -m http.server'])
+        # Detect known async-style commands with a single compiled scan
+        is_async = _ASYNC_CMD_RE.search(original_command) is not None
 
         def run_command(command, cwd=None):
             """Execute the given command, optionally in a different working directory (cwd).
@@ -64,25 +72,53 @@ class ShellCommand(Command):
 
                 if is_async:
                     console.print("[yellow]Running in async mode (Ctrl+C to return to REPL)[/yellow]")
-                    os.system(command)
+                    # Exec the program directly unless the command needs
+                    # shell features; os.system forked a throwaway shell
+                    # around every async command
+                    if any(ch in command for ch in ('|', '>', '<', ';', '&', '$', '`')):
+                        subprocess.run(command, shell=True, check=False, cwd=cwd)  # nosec B602
+                    else:
+                        subprocess.run(shlex.split(command), check=False, cwd=cwd)
                     console.print("[green]Async command completed or detached[/green]")
                     return True
 
-                # Run synchronously and stream output
+                # Run synchronously and stream output in bulk reads:
+                # one os.read per ready chunk instead of a Python-level
+                # readline per output line (nmap/ffuf-style tools emit
+                # thousands of small lines)
                 process = subprocess.Popen(
                     command, shell=True, stdout=subprocess.PIPE,
-                    stderr=subprocess.STDOUT, universal_newlines=True,
-                    bufsize=1, cwd=cwd
+                    stderr=subprocess.STDOUT, cwd=cwd
                 )
-                for line in iter(process.stdout.readline, ''):
-                    print(line, end='')
-
-                process.wait()
+                try:
+                    # Fast path: short commands (ls, id, cat) usually
+                    # finish within the window, so the whole pipe can be
+                    # drained in a single read with no polling loop
+                    process.wait(timeout=0.25)
+                    data = process.stdout.read()
+                    if data:
+                        sys.stdout.buffer.write(data)
+                        sys.stdout.buffer.flush()
+                except subprocess.TimeoutExpired:
+                    fd = process.stdout.fileno()
+                    while True:
+                        ready, _, _ = select.select([process.stdout], [], [], 0.1)
+                        if ready:
+                            data = os.read(fd, 65536)
+                            if data:
+                                sys.stdout.buffer.write(data)
+                                sys.stdout.buffer.flush()
+                            elif process.poll() is not None:
+                                break
+                        elif process.poll() is not None:
+                            break
+
+                    process.wait()
 
                 if process.returncode == 0:
                     console.print("[green]Command completed successfully[/green]")
                 else:
-                    console.print(f"[yellow]Command exited with code {process.returncode}[/yellow]")
+                    console.print(f"[yellow]Command exited with code {process.returncode}[/yellow]", highlight=False)
                 return True
 
             except KeyboardInterrupt:
@@ -102,9 +138,9 @@ class ShellCommand(Command):
         if active_container:
             # If running in a Docker container
             container_workspace = _get_container_workspace_path()
-            console.print(f"[dim]Running in container: {active_container[:12]}...[/dim]")
+            console.print(f"[dim]Running in container: {active_container[:12]}...[/dim]", highlight=False)
             docker_cmd = f"docker exec -w '{container_workspace}' {active_container} sh -c {original_command!r}"
-            console.print(f"[blue]Executing in container workspace '{container_workspace}':[/blue] {original_command}")
+            console.print(f"[blue]Executing in container workspace '{container_workspace}':[/blue] {original_command}", highlight=False)
 
             success = run_command(docker_cmd)
 
@@ -118,7 +154,7 @@ class ShellCommand(Command):
 
         # If no container, run command in local workspace
         host_workspace = _get_workspace_dir()
-        console.print(f"[dim]Running in workspace: {host_workspace}[/dim]")
+        console.print(f"[dim]Running in workspace: {host_workspace}[/dim]", highlight=False)
 
         return run_command(original_command, cwd=host_workspace)
 
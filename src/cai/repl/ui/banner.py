@@ -6,7 +6,7 @@ import os
 import glob
 import logging
 import sys
-from configparser import ConfigParser
+from functools import lru_cache
 
 # Third-party imports
 import requests  # pylint: disable=import-error
@@ -25,8 +25,17 @@ else:
         pass
 
 
+@lru_cache(maxsize=1)
 def get_version():
-    """Get the CAI version from pyproject.toml."""
+    """Get the CAI version (cached; it cannot change mid-process)."""
+    # Installed-package metadata is the cheap, location-independent
+    # source; fall back to parsing pyproject.toml for source checkouts
+    try:
+        from importlib.metadata import version as pkg_version
+        return pkg_version('cai-framework')
+    except Exception:  # pylint: disable=broad-except
+        pass
+
     version = "unknown"
     try:
         # Determine which TOML parser to use
@@ -151,18 +160,10 @@ def count_ctf_memories():
     return "100+"
 
 
-def display_banner(console: Console):
-    """
-    Display a stylized CAI banner with Alias Robotics corporate colors.
-
-    Args:
-        console: Rich console for output
-    """
-    version = get_version()
-
-    # Original banner with Alias Robotics colors (blue and white)
-    # Use noqa to ignore line length for the ASCII art
-    banner = f"""
+# Original banner with Alias Robotics colors (blue and white), built
+# once at import; only the version is substituted at display time.
+# Use noqa to ignore line length for the ASCII art
+_BANNER_TEMPLATE = """
 [bold blue]                CCCCCCCCCCCCC      ++++++++   ++++++++      IIIIIIIIII
 [bold blue]             CCC::::::::::::C  ++++++++++       ++++++++++  I::::::::I
 [bold blue]           CC:::::::::::::::C ++++++++++         ++++++++++ I::::::::I
@@ -184,7 +185,15 @@ def display_banner(console: Console):
 [white]                                  Bug bounty-ready AI[/white]
     """
 
-    console.print(banner, end="")
+
+def display_banner(console: Console):
+    """
+    Display a stylized CAI banner with Alias Robotics corporate colors.
+
+    Args:
+        console: Rich console for output
+    """
+    console.print(_BANNER_TEMPLATE.format(version=get_version()), end="")
 
     # # Create a table showcasing CAI framework capabilities
     # #
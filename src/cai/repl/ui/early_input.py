@@ -0,0 +1,120 @@
+"""
+Module for capturing keystrokes typed during CAI startup.
+
+Banner rendering, agent construction and session logging all run before
+the first prompt is shown; keystrokes typed in that window would
+otherwise be silently dropped. This module buffers raw stdin while CAI
+starts up so the first prompt can be pre-filled with whatever the user
+already typed.
+"""
+import atexit
+import os
+import select
+import sys
+import threading
+
+# Capture state shared between the reader thread and the REPL
+_capture_state = {
+    'buffer': bytearray(),
+    'thread': None,
+    'active': False,
+    'old_settings': None,
+}
+
+
+def _restore_terminal():
+    """Restore the saved terminal settings if they are still pending.
+
+    Runs from drain_early_input on the normal path and from atexit as
+    a safety net, so a startup crash between capture and the first
+    prompt can't leave the user's shell in cbreak mode (echo off).
+    """
+    if _capture_state['old_settings'] is None:
+        return
+    try:
+        import termios  # pylint: disable=import-outside-toplevel
+
+        termios.tcsetattr(
+            sys.stdin.fileno(),
+            termios.TCSADRAIN,
+            _capture_state['old_settings'],
+        )
+    except Exception:  # pylint: disable=broad-except
+        pass
+    _capture_state['old_settings'] = None
+
+
+def start_capturing_early_input():
+    """
+    Start buffering keystrokes typed before the first prompt.
+
+    Puts the terminal in cbreak mode and reads stdin from a daemon
+    thread. No-op when stdin is not a TTY (pipes, CI) or on platforms
+    without termios.
+    """
+    if _capture_state['active']:
+        return
+    try:
+        if not sys.stdin.isatty():
+            return
+    except (AttributeError, ValueError):
+        return
+
+    try:
+        import termios  # pylint: disable=import-outside-toplevel
+        import tty  # pylint: disable=import-outside-toplevel
+
+        fd = sys.stdin.fileno()
+        _capture_state['old_settings'] = termios.tcgetattr(fd)
+        tty.setcbreak(fd)
+    except Exception:  # pylint: disable=broad-except
+        # Windows or exotic terminals: skip early capture entirely
+        return
+
+    _capture_state['active'] = True
+    # Safety net: restore the terminal even if startup dies before the
+    # first prompt ever drains the capture
+    atexit.register(_restore_terminal)
+
+    def _reader():
+        read_fd = sys.stdin.fileno()
+        while _capture_state['active']:
+            try:
+                ready, _, _ = select.select([read_fd], [], [], 0.05)
+                if ready:
+                    data = os.read(read_fd, 4096)
+                    if not data:
+                        break
+                    _capture_state['buffer'].extend(data)
+            except Exception:  # pylint: disable=broad-except
+                break
+
+    thread = threading.Thread(target=_reader, daemon=True)
+    _capture_state['thread'] = thread
+    thread.start()
+
+
+def drain_early_input():
+    """
+    Stop capturing and return whatever was typed during startup.
+
+    Restores the previous terminal settings and returns the buffered
+    text with control characters stripped, ready to pre-fill the first
+    prompt. Returns an empty string when capture never started.
+    """
+    if not _capture_state['active']:
+        return ""
+
+    _capture_state['active'] = False
+    thread = _capture_state['thread']
+    if thread is not None:
+        thread.join(timeout=0.2)
+        _capture_state['thread'] = None
+
+    _restore_terminal()
+
+    text = _capture_state['buffer'].decode('utf-8', errors='ignore')
+    _capture_state['buffer'] = bytearray()
+    # Strip control characters (e.g. a stray Enter) so nothing
+    # auto-submits on the first prompt
+    return ''.join(ch for ch in text if ch.isprintable())
@@ -21,6 +21,11 @@ def create_key_bindings(current_text):
     """
     kb = KeyBindings()
 
+    # Shared helper instances for the handlers below; building a fresh
+    # completer or auto-suggester on every keypress is wasted work
+    completer = FuzzyCommandCompleter()
+    auto_suggest = AutoSuggestFromHistory()
+
     @kb.add('c-l')
     def _(event):  # pylint: disable=unused-argument
         """Clear the screen."""
@@ -51,7 +56,6 @@ def create_key_bindings(current_text):
         history_suggestion = None
         if text:
             # Get suggestion from history
-            auto_suggest = AutoSuggestFromHistory()
             suggestion = auto_suggest.get_suggestion(buffer, buffer.document)
             if suggestion and suggestion.text:
                 history_suggestion = text + suggestion.text
@@ -63,7 +67,7 @@ def create_key_bindings(current_text):
         else:
             # If no history suggestion, check for command shadow from fuzzy
             # completer
-            shadow = FuzzyCommandCompleter().get_command_shadow(text)
+            shadow = completer.get_command_shadow(text)
             if shadow and shadow.startswith(text):
                 # Complete with the shadow
                 buffer.text = shadow
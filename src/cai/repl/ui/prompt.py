@@ -3,7 +3,7 @@ Module for CAI REPL prompt functionality.
 """
 import time
 from functools import lru_cache
-from prompt_toolkit import prompt  # pylint: disable=import-error
+from prompt_toolkit import PromptSession  # pylint: disable=import-error
 from prompt_toolkit.history import FileHistory  # pylint: disable=import-error
 from prompt_toolkit.auto_suggest import AutoSuggestFromHistory  # pylint: disable=import-error # noqa: E501
 from prompt_toolkit.styles import Style  # pylint: disable=import-error
@@ -54,8 +54,29 @@ def get_command_shadow(text):
     return result
 
 
+# Constant prompt fragments, allocated once instead of per prompt() call
+PROMPT_MESSAGE = [('class:prompt', 'CAI> ')]
+
+# Reused PromptSession: keeps one prompt_toolkit Application (and the
+# file-backed history it owns) alive across turns instead of rebuilding
+# everything on each call
+_prompt_session = None
+
+
+def _get_prompt_session(history_file):
+    """Create the shared PromptSession on first use."""
+    global _prompt_session  # pylint: disable=global-statement
+    if _prompt_session is None:
+        _prompt_session = PromptSession(
+            history=FileHistory(str(history_file)),
+            auto_suggest=AutoSuggestFromHistory(),
+        )
+    return _prompt_session
+
+
+@lru_cache(maxsize=1)
 def create_prompt_style():
-    """Create a style for the CLI."""
+    """Create a style for the CLI (cached; the style never changes)."""
     return Style.from_dict({
         'prompt': 'bold cyan',
         'completion-menu': 'bg:#2b2b2b #ffffff',
@@ -71,7 +92,8 @@ def get_user_input(
     key_bindings,
     history_file,
     toolbar_func,
-    current_text
+    current_text,
+    default=''
 ):
     """
     Get user input with all prompt features.
@@ -82,6 +104,8 @@ def get_user_input(
         history_file: Path to history file
         toolbar_func: Function to get toolbar content
         current_text: Reference to current text for command shadowing
+        default: Text to pre-fill the prompt with (e.g. keystrokes
+            captured during startup)
 
     Returns:
         User input string
@@ -95,15 +119,16 @@ def get_user_input(
         return HTML(f'<ansigray>{shadow}</ansigray>')
 
     # Get user input with all features
-    return prompt(
-        [('class:prompt', 'CAI> ')],
+    return _get_prompt_session(history_file).prompt(
+        PROMPT_MESSAGE,
         completer=command_completer,
         style=create_prompt_style(),
-        history=FileHistory(str(history_file)),
-        auto_suggest=AutoSuggestFromHistory(),
         key_bindings=key_bindings,
         bottom_toolbar=toolbar_func,
-        complete_in_thread=True,
+        # The completer is dict lookups over precomputed tables (cache
+        # refreshes happen on daemon threads), so the per-event worker
+        # thread costs more than the completion itself
+        complete_in_thread=False,
         complete_while_typing=True,  # Enable real-time completion
         enable_system_prompt=True,  # Enable shadow prediction
         mouse_support=False,  # Enable mouse support for menu navigation
@@ -112,4 +137,5 @@ def get_user_input(
         multiline=False,  # Enable multiline input
         rprompt=get_rprompt,
         color_depth=None,  # Auto-detect color support
+        default=default,
     )
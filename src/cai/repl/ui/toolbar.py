@@ -21,7 +21,8 @@ toolbar_cache = {
     'html': "",
     'last_update': datetime.datetime.now(),
     'refresh_interval': 5,  # Refresh every 5 seconds
-    'context_warning_shown': False  # Track if we've shown context warning
+    'context_warning_shown': False,  # Track if we've shown context warning
+    'updating': False  # True while a background refresh is in flight
 }
 
 # Cache for system information that rarely changes
@@ -62,6 +63,7 @@ def get_terminal_width():
 
 def update_toolbar_in_background():
     """Update the toolbar cache in a background thread."""
+    toolbar_cache['updating'] = True
     try:
         # Get system info (cached)
         sys_info = get_system_info()
@@ -232,6 +234,8 @@ def update_toolbar_in_background():
         toolbar_cache['html'] = HTML(
             f"<ansigray>{datetime.datetime.now().strftime('%H:%M')}</ansigray>"
         )
+    finally:
+        toolbar_cache['updating'] = False
 
 
 def get_bottom_toolbar():
@@ -259,8 +263,10 @@ def get_toolbar_with_refresh():
     now = datetime.datetime.now()
     seconds_elapsed = (now - toolbar_cache['last_update']).total_seconds()
     
-    # Check if we need to refresh the toolbar
-    if seconds_elapsed >= toolbar_cache['refresh_interval']:
+    # Check if we need to refresh the toolbar; skip if a refresh is
+    # already in flight so rapid keystrokes don't pile up threads
+    if (seconds_elapsed >= toolbar_cache['refresh_interval']
+            and not toolbar_cache['updating']):
         # Start a background thread to update the toolbar
         threading.Thread(
             target=update_toolbar_in_background,
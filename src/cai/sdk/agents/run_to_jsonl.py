@@ -5,7 +5,9 @@ Data recorder
 import os  # pylint: disable=import-error
 from datetime import datetime
 import json
+import queue
 import socket
+import threading
 import urllib.request
 import getpass
 import platform
@@ -16,9 +18,47 @@ from cai.util import get_active_time, get_idle_time
 import atexit
 from typing import List, Dict, Tuple
 
+try:
+    import orjson  # pylint: disable=import-error
+except ImportError:
+    orjson = None
+
+# Line parser for reading session logs back: orjson's C parser when
+# available, stdlib json otherwise
+_loads = orjson.loads if orjson is not None else json.loads
+
 # Global recorder instance for session-wide logging
 _session_recorder = None
 
+# Session timestamps are all stamped in the same timezone; resolve it
+# once instead of doing the pytz database lookup on every record
+_LOG_TZ = pytz.timezone("Europe/Madrid")
+
+
+def _now_iso():
+    """Current local time as an ISO-8601 string for log records."""
+    return datetime.now().astimezone(_LOG_TZ).isoformat()
+
+
+def _dump_jsonl_line(record, f):
+    """
+    Serialize one record as a JSONL line.
+
+    Uses orjson when available — the per-interaction records embed the
+    full message history, where the stdlib encoder is the bottleneck —
+    and falls back to the stdlib json module otherwise.
+    """
+    if orjson is not None:
+        try:
+            f.write(orjson.dumps(record).decode('utf-8'))
+            f.write('\n')
+            return
+        except TypeError:
+            # orjson is stricter about input types; retry with stdlib json
+            pass
+    json.dump(record, f)
+    f.write('\n')
+
 
 def get_session_recorder(workspace_name=None):
     """
@@ -115,7 +155,7 @@ class DataRecorder:  # pylint: disable=too-few-public-methods
 
         # Create filename with username, OS info, and IP
         timestamp = datetime.now().astimezone(
-            pytz.timezone("Europe/Madrid")).strftime("%Y%m%d_%H%M%S")
+            _LOG_TZ).strftime("%Y%m%d_%H%M%S")
         base_filename = f'cai_{self.session_id}_{timestamp}_{username}_{os_info}_{public_ip.replace(".", "_")}.jsonl'
 
         if workspace_name:
@@ -128,17 +168,67 @@ class DataRecorder:  # pylint: disable=too-few-public-methods
         # Inicializar el coste total acumulado
         self.total_cost = 0.0
 
+        # Keep a single buffered append handle for the whole session
+        # instead of re-opening the file on every write
+        self._file = open(self.filename, 'a', buffering=8192, encoding='utf-8')  # pylint: disable=consider-using-with  # noqa: E501
+
+        # Hand records to a background writer so disk latency never
+        # blocks the REPL between turns
+        self._queue = queue.Queue()
+        self._worker = threading.Thread(target=self._drain_queue, daemon=True)
+        self._worker.start()
+
         # Log the session start
-        with open(self.filename, 'a', encoding='utf-8') as f:
-            session_start = {
-                "event": "session_start",
-                "timestamp": datetime.now().astimezone(
-                    pytz.timezone("Europe/Madrid")).isoformat(),
-                "session_id": self.session_id,
-                "alias_api_key": os.getenv("ALIAS_API_KEY", ""),
-            }
-            json.dump(session_start, f)
-            f.write('\n')
+        session_start = {
+            "event": "session_start",
+            "timestamp": _now_iso(),
+            "session_id": self.session_id,
+            "alias_api_key": os.getenv("ALIAS_API_KEY", ""),
+        }
+        self._write_record(session_start)
+
+    def _drain_queue(self) -> None:
+        """Background writer: drains queued records into the log file."""
+        while True:
+            record = self._queue.get()
+            try:
+                if record is None:  # Shutdown sentinel
+                    return
+                try:
+                    _dump_jsonl_line(record, self._file)
+                    self._file.flush()
+                except Exception:  # pylint: disable=broad-except
+                    # Never let a failed write kill the writer thread
+                    pass
+            finally:
+                self._queue.task_done()
+
+    def _write_record(self, record) -> None:
+        """
+        Queues a single record for the background writer. Falls back to
+        a synchronous write if the writer has already shut down (e.g.
+        during interpreter exit).
+        """
+        if self._worker.is_alive():
+            self._queue.put(record)
+            return
+        if self._file.closed:
+            self._file = open(self.filename, 'a', buffering=8192, encoding='utf-8')  # pylint: disable=consider-using-with  # noqa: E501
+        _dump_jsonl_line(record, self._file)
+        self._file.flush()
+
+    def flush(self) -> None:
+        """Blocks until every queued record has reached the file."""
+        if self._worker.is_alive():
+            self._queue.join()
+
+    def close(self) -> None:
+        """Stops the writer thread and closes the log file handle."""
+        if self._worker.is_alive():
+            self._queue.put(None)
+            self._worker.join(timeout=2)
+        if not self._file.closed:
+            self._file.close()
 
     def rec_training_data(self, create_params, msg, total_cost=None, agent_name=None) -> None:
         """
@@ -256,16 +346,12 @@ class DataRecorder:  # pylint: disable=too-few-public-methods
                 "active_seconds": active_time_seconds,
                 "idle_seconds": idle_time_seconds
             },
-            "timestamp_iso": datetime.now().astimezone(
-                pytz.timezone("Europe/Madrid")).isoformat()
+            "timestamp_iso": _now_iso()
         }
 
         # Append both request and completion to the instance's jsonl file
-        with open(self.filename, 'a', encoding='utf-8') as f:
-            json.dump(request_data, f)
-            f.write('\n')
-            json.dump(completion_data, f)
-            f.write('\n')
+        self._write_record(request_data)
+        self._write_record(completion_data)
 
     def log_user_message(self, user_message):
         """
@@ -274,15 +360,12 @@ class DataRecorder:  # pylint: disable=too-few-public-methods
         Args:
             user_message: The message from the user to log
         """
-        with open(self.filename, 'a', encoding='utf-8') as f:
-            user_data = {
-                "event": "user_message",
-                "timestamp": datetime.now().astimezone(
-                    pytz.timezone("Europe/Madrid")).isoformat(),
-                "content": user_message
-            }
-            json.dump(user_data, f)
-            f.write('\n')
+        user_data = {
+            "event": "user_message",
+            "timestamp": _now_iso(),
+            "content": user_message
+        }
+        self._write_record(user_data)
     
     def log_assistant_message(self, assistant_message, tool_calls=None):
         """
@@ -296,18 +379,15 @@ class DataRecorder:  # pylint: disable=too-few-public-methods
         self.last_assistant_message = assistant_message
         self.last_assistant_tool_calls = tool_calls
         
-        with open(self.filename, 'a', encoding='utf-8') as f:
-            assistant_data = {
-                "event": "assistant_message",
-                "timestamp": datetime.now().astimezone(
-                    pytz.timezone("Europe/Madrid")).isoformat(),
-                "content": assistant_message
-            }
-            if tool_calls:
-                assistant_data["tool_calls"] = tool_calls
-            json.dump(assistant_data, f)
-            f.write('\n')
-            
+        assistant_data = {
+            "event": "assistant_message",
+            "timestamp": _now_iso(),
+            "content": assistant_message
+        }
+        if tool_calls:
+            assistant_data["tool_calls"] = tool_calls
+        self._write_record(assistant_data)
+
         # Mark that the message has been logged
         self._last_message_logged = True
     
@@ -330,24 +410,24 @@ class DataRecorder:  # pylint: disable=too-few-public-methods
             idle_time = 0.0
             session_cost = self.total_cost
             
-        with open(self.filename, 'a', encoding='utf-8') as f:
-            session_end = {
-                "event": "session_end",
-                "timestamp": datetime.now().astimezone(
-                    pytz.timezone("Europe/Madrid")).isoformat(),
-                "session_id": self.session_id,
-                "timing_metrics": {
-                    "active_time_seconds": active_time,
-                    "idle_time_seconds": idle_time,
-                    "total_time_seconds": active_time + idle_time,
-                    "active_percentage": round((active_time / (active_time + idle_time)) * 100, 2) if (active_time + idle_time) > 0 else 0.0
-                },
-                "cost": {
-                    "total_cost": session_cost  # Use the global session cost
-                }
+        session_end = {
+            "event": "session_end",
+            "timestamp": _now_iso(),
+            "session_id": self.session_id,
+            "timing_metrics": {
+                "active_time_seconds": active_time,
+                "idle_time_seconds": idle_time,
+                "total_time_seconds": active_time + idle_time,
+                "active_percentage": round((active_time / (active_time + idle_time)) * 100, 2) if (active_time + idle_time) > 0 else 0.0
+            },
+            "cost": {
+                "total_cost": session_cost  # Use the global session cost
             }
-            json.dump(session_end, f)
-            f.write('\n')
+        }
+        self._write_record(session_end)
+        # Session end is read back by telemetry/symlink handling right
+        # away, so wait for the writer to catch up
+        self.flush()
 
 def load_history_from_jsonl(file_path: str, system_prompt: bool = False) -> List[Dict]:
     """
@@ -371,7 +451,7 @@ def load_history_from_jsonl(file_path: str, system_prompt: bool = False) -> List
         for line in f:
             if line.strip():
                 try:
-                    records.append(json.loads(line))
+                    records.append(_loads(line))
                 except Exception as e:
                     print(f"Error loading line: {e}")
                     continue
@@ -459,12 +539,11 @@ def load_history_from_jsonl(file_path: str, system_prompt: bool = False) -> List
                     break
             
             # Check if we already have this user message with the same responding agent
-            for existing_msg in unique_messages:
-                if (existing_msg.get("role") == "user" and 
+            for existing_idx, existing_msg in enumerate(unique_messages):
+                if (existing_msg.get("role") == "user" and
                     existing_msg.get("content") == msg.get("content")):
                     # Find the agent that responded to the existing message
                     existing_responding_agent = None
-                    existing_idx = unique_messages.index(existing_msg)
                     for k in range(existing_idx + 1, len(unique_messages)):
                         if (unique_messages[k].get("role") == "assistant" and 
                             unique_messages[k].get("agent_name")):
@@ -562,7 +641,7 @@ def get_token_stats(file_path):
             if not line:
                 continue
             try:
-                record = json.loads(line)
+                record = _loads(line)
                 if "usage" in record:
                     total_prompt_tokens += record["usage"]["prompt_tokens"]
                     total_completion_tokens += (
@@ -620,11 +699,12 @@ def atexit_handler():
             )
     
     # Check if we've already logged the session end (via KeyboardInterrupt)
-    if getattr(_session_recorder, '_session_end_logged', False):
-        return
-    
-    # Log the session end
-    _session_recorder.log_session_end()
+    if not getattr(_session_recorder, '_session_end_logged', False):
+        # Log the session end
+        _session_recorder.log_session_end()
+
+    # Release the persistent log file handle
+    _session_recorder.close()
 
 # Register the exit handler
 atexit.register(atexit_handler)
\ No newline at end of file
@@ -2,14 +2,27 @@
 RAG (Retrieval Augmented Generation) utilities module for
 querying and adding data to vector databases.
 """
+import functools
 import os
 import uuid
-from cai.rag.vector_db import QdrantConnector
 from cai.sdk.agents import function_tool
 
 # CTF BASED MEMORY
 collection_name = os.getenv('CAI_MEMORY_COLLECTION', "default")
 
+
+@functools.lru_cache(maxsize=1)
+def _get_db():
+    """Shared QdrantConnector, created lazily on first memory tool call.
+
+    Reconnecting per call re-establishes the client connection every
+    time; the connector itself is stateless across calls so one
+    instance serves the whole session. The import is deferred too so
+    merely importing this module doesn't pull in the vector-db stack.
+    """
+    from cai.rag.vector_db import QdrantConnector  # pylint: disable=import-outside-toplevel
+    return QdrantConnector()
+
 @function_tool
 def query_memory(query: str, top_k: int = 3, **kwargs) -> str:  # pylint: disable=unused-argument,line-too-long # noqa: E501
     """
@@ -24,7 +37,7 @@ def query_memory(query: str, top_k: int = 3, **kwargs) -> str:  # pylint: disabl
             with the most relevant matches
     """
     try:
-        qdrant = QdrantConnector()
+        qdrant = _get_db()
 
         # First try semantic search
         results = qdrant.search(
@@ -55,7 +68,7 @@ def add_to_memory_episodic(texts: str, step: int = 0, **kwargs) -> str:  # pylin
         str: Status message indicating success or failure
     """
     try:
-        qdrant = QdrantConnector()
+        qdrant = _get_db()
         try:
             qdrant.create_collection(collection_name)
         except Exception:  # nosec # pylint: disable=broad-exception-caught
@@ -92,7 +105,7 @@ def add_to_memory_semantic(texts: str, step: int = 0, **kwargs) -> str:  # pylin
     """
     doc_id = str(uuid.uuid4())
     try:
-        qdrant = QdrantConnector()
+        qdrant = _get_db()
         try:
             qdrant.create_collection("_all_")
         except Exception:  # nosec # pylint: disable=broad-exception-caught
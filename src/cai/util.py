@@ -14,9 +14,9 @@ import time
 import uuid
 from dataclasses import dataclass, field
 from datetime import datetime
+from functools import lru_cache
 from typing import Dict, Optional
 
-from mako.template import Template  # pylint: disable=import-error
 from rich.box import ROUNDED  # pylint: disable=import-error
 from rich.console import Console, Group
 from rich.panel import Panel  # pylint: disable=import-error
@@ -782,6 +782,27 @@ def get_ollama_auth_headers():
     return {}
 
 
+@lru_cache(maxsize=None)
+def _read_template_resource(package, filename):
+    """Read a template file from package resources once per process."""
+    # Handle different importlib.resources APIs between Python versions
+    try:
+        # Python 3.9+ API
+        return importlib.resources.read_text(package, filename)
+    except (TypeError, AttributeError):
+        # Fallback for Python 3.8 and earlier
+        with importlib.resources.path(package, filename) as path:
+            return pathlib.Path(path).read_text(encoding="utf-8")
+
+
+@lru_cache(maxsize=None)
+def _compile_template(package, filename):
+    """Compile a Mako template from package resources once per process."""
+    from mako.template import Template  # pylint: disable=import-error,import-outside-toplevel
+
+    return Template(_read_template_resource(package, filename))
+
+
 def load_prompt_template(template_path):
     """
     Load a prompt template from the package resources.
@@ -800,18 +821,8 @@ def load_prompt_template(template_path):
         package = ".".join(package_path)
         filename = template_path_parts[-1]
 
-        # Read the content from the package resources
-        # Handle different importlib.resources APIs between Python versions
-        try:
-            # Python 3.9+ API
-            template_content = importlib.resources.read_text(package, filename)
-        except (TypeError, AttributeError):
-            # Fallback for Python 3.8 and earlier
-            with importlib.resources.path(package, filename) as path:
-                template_content = pathlib.Path(path).read_text(encoding="utf-8")
-
-        # Render the template
-        return Template(template_content).render()
+        # Render the cached compiled template
+        return _compile_template(package, filename).render()
     except Exception as e:
         raise ValueError(f"Failed to load template '{template_path}': {str(e)}")
 
@@ -848,19 +859,6 @@ def create_system_prompt_renderer(base_instructions):
             # run_context might be the context_variables directly (for testing)
             context_variables = run_context
         try:
-            # Get the master template content
-            template_path_parts = "prompts/core/system_master_template.md".split("/")
-            package_path = ["cai"] + template_path_parts[:-1]
-            package = ".".join(package_path)
-            filename = template_path_parts[-1]
-            
-            # Read the template content
-            try:
-                template_content = importlib.resources.read_text(package, filename)
-            except (TypeError, AttributeError):
-                with importlib.resources.path(package, filename) as path:
-                    template_content = pathlib.Path(path).read_text(encoding="utf-8")
-            
             # Create the rendering context with all necessary variables
             render_context = {
                 'agent': agent,
@@ -874,8 +872,10 @@ def create_system_prompt_renderer(base_instructions):
                 'globals': globals,
             }
             
-            # Render the template with the full context
-            rendered = Template(template_content).render(**render_context)
+            # Render the cached compiled master template with the full context
+            rendered = _compile_template(
+                "cai.prompts.core", "system_master_template.md"
+            ).render(**render_context)
             return rendered
             
         except Exception as e:
@@ -1414,17 +1414,30 @@ def fix_message_list(messages):  # pylint: disable=R0914,R0915,R0912
     return processed_messages
 
 
+# Static colored labels for cli_print_tool_call: wasabi.color resolves
+# the palette and builds the escape sequence per call, so render these
+# once at import
+_TOOL_CALL_LABEL = color('Tool Call:', fg='cyan')
+_TOOL_NAME_LABEL = color('Name:', fg='cyan')
+_TOOL_ARGS_LABEL = color('Args:', fg='cyan')
+_TOOL_OUTPUT_LABEL = color('Output:', fg='cyan')
+
+
 def cli_print_tool_call(tool_name="", args="", output="", prefix="  "):
     """Print a tool call with pretty formatting"""
     if not tool_name:
         return
 
-    print(f"{prefix}{color('Tool Call:', fg='cyan')}")
-    print(f"{prefix}{color('Name:', fg='cyan')} {tool_name}")
+    # Batch the lines into a single write instead of one print per field
+    lines = [
+        f"{prefix}{_TOOL_CALL_LABEL}",
+        f"{prefix}{_TOOL_NAME_LABEL} {tool_name}",
+    ]
     if args:
-        print(f"{prefix}{color('Args:', fg='cyan')} {args}")
+        lines.append(f"{prefix}{_TOOL_ARGS_LABEL} {args}")
     if output:
-        print(f"{prefix}{color('Output:', fg='cyan')} {output}")
+        lines.append(f"{prefix}{_TOOL_OUTPUT_LABEL} {output}")
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def get_model_input_tokens(model):
@@ -1467,16 +1480,15 @@ def format_time(seconds):
     if seconds is None:
         return "N/A"
 
-    if seconds < 60:
-        return f"{seconds:.1f}s"
-    elif seconds < 3600:
-        minutes = int(seconds / 60)
-        seconds_remainder = seconds % 60
-        return f"{minutes}m {seconds_remainder:.1f}s"
-    else:
-        hours = int(seconds / 3600)
-        minutes = int((seconds % 3600) / 60)
+    # divmod yields quotient and remainder in one call, avoiding the
+    # separate division/modulo pairs of the naive version
+    minutes, seconds_remainder = divmod(seconds, 60)
+    hours, minutes = divmod(int(minutes), 60)
+    if hours:
         return f"{hours}h {minutes}m"
+    if minutes:
+        return f"{minutes}m {seconds_remainder:.1f}s"
+    return f"{seconds_remainder:.1f}s"
 
 
 def get_model_pricing(model_name):
@@ -1764,8 +1776,6 @@ def parse_message_tool_call(message, tool_output=None):
                     tool_name = tool_call.function.name
                 if hasattr(tool_call.function, "arguments"):
                     try:
-                        import json
-
                         args_dict = json.loads(tool_call.function.arguments)
                     except:
                         args_dict = {"raw_arguments": tool_call.function.arguments}
@@ -1775,8 +1785,6 @@ def parse_message_tool_call(message, tool_output=None):
                         tool_name = tool_call["function"]["name"]
                     if "arguments" in tool_call["function"]:
                         try:
-                            import json
-
                             args_dict = json.loads(tool_call["function"]["arguments"])
                         except:
                             args_dict = {"raw_arguments": tool_call["function"]["arguments"]}
@@ -3195,6 +3203,9 @@ def _format_tool_args(args, tool_name=None):
             return args
 
     # Format arguments from a dictionary
+    # NOTE: mixed value types (str/dict/list/None) rule out Numba-style
+    # JIT here; keep optimizations at the CPython level (single parse,
+    # no intermediate copies).
     if isinstance(args, dict):
         # Only include non-empty values and exclude special flags
         arg_parts = []
@@ -3206,16 +3217,17 @@ def _format_tool_args(args, tool_name=None):
             if key in ["async_mode", "streaming"] and not value:
                 continue
 
-            value_str = str(value)
-
-            # Format the value
+            # Format the value in a single pass, avoiding a redundant
+            # str() copy for values that are already strings
             if isinstance(value, str):
                 # Truncate long string values
-                if len(value_str) > 70 and key not in ["code", "args"]:
-                    value_str = value_str[:67] + "..."
-                arg_parts.append(f"{key}={value_str}")
+                if len(value) > 70 and key not in ("code", "args"):
+                    value_str = value[:67] + "..."
+                else:
+                    value_str = value
             else:
-                arg_parts.append(f"{key}={value_str}")
+                value_str = str(value)
+            arg_parts.append(f"{key}={value_str}")
         return ", ".join(arg_parts)
     else:
         return str(args)
@@ -4347,11 +4359,11 @@ def check_flag(output, ctf, challenge=None):
     # Get the challenge from the environment variable or default to the first
     # challenge
     challenge_key = os.getenv("CTF_CHALLENGE")
-    challenges = list(ctf.get_challenges().keys())
+    challenges = ctf.get_challenges()
     challenge = (
         challenge_key
         if challenge_key in challenges
-        else (challenges[0] if len(challenges) > 0 else None)
+        else next(iter(challenges), None)
     )
     if ctf:
         if ctf.check_flag(output, challenge):  # check if the flag is in the output
@@ -4367,6 +4379,35 @@ def check_flag(output, ctf, challenge=None):
     return False, None
 
 
+_USER_MASTER_TEMPLATE = None
+
+
+def _get_user_master_template():
+    """Lazily compile and cache the user master Mako template.
+
+    Template compilation re-reads and re-parses the file from disk, so
+    keep a single compiled instance at module scope and reuse it. The
+    template embeds Python code and %if blocks, so it cannot be reduced
+    to a plain str.format call — caching the compiled Template is the
+    right trade-off here.
+    """
+    global _USER_MASTER_TEMPLATE  # pylint: disable=global-statement
+    if _USER_MASTER_TEMPLATE is None:
+        from mako.template import Template  # pylint: disable=import-error,import-outside-toplevel
+
+        try:
+            template_path = (
+                importlib.resources.files("cai.prompts.core") / "user_master_template.md"
+            )
+            _USER_MASTER_TEMPLATE = Template(filename=str(template_path))
+        except (TypeError, AttributeError):
+            # Fallback for older importlib.resources APIs
+            _USER_MASTER_TEMPLATE = Template(
+                filename="src/cai/prompts/core/user_master_template.md"
+            )
+    return _USER_MASTER_TEMPLATE
+
+
 def setup_ctf():
     """Setup CTF environment if CTF_NAME is provided"""
     ctf_name = os.getenv("CTF_NAME", None)
@@ -4394,18 +4435,18 @@ def setup_ctf():
     # Get the challenge from the environment variable or default to the
     # first challenge
     challenge_key = os.getenv("CTF_CHALLENGE")  # TODO:
-    challenges = list(ctf.get_challenges().keys())
+    challenges = ctf.get_challenges()
     challenge = (
-        challenge_key
-        if challenge_key in challenges
-        else (challenges[0] if len(challenges) > 0 else None)
+        challenge_key if challenge_key in challenges else next(iter(challenges), None)
     )
 
-    # Use the user master template
-    messages = Template(filename="src/cai/prompts/core/user_master_template.md").render(
+    # Use the user master template; resolve the target IP once instead of
+    # asking the CTF environment again inside the render arguments
+    ip = ctf.get_ip()
+    messages = _get_user_master_template().render(
         ctf=ctf,
         challenge=challenge,
-        ip=ctf.get_ip() if ctf else None,
+        ip=ip,
     )
 
     print(